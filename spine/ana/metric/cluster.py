@@ -133,34 +133,39 @@ class ClusterAna(AnaBase):
             else:
                 # Rebuild the labels
                 num_points = len(data['points'])
-                labels = -np.ones(num_points)
-                num_truth = len(data[f'truth_{obj_type}s'])
-                for i, obj in enumerate(data[f'truth_{obj_type}s']):
-                    labels[obj.index_adapt] = i
+                truth_objs = data[f'truth_{obj_type}s']
+                num_truth = len(truth_objs)
+                labels = self.scatter_labels(
+                        num_points, [obj.index_adapt for obj in truth_objs])
 
             # Build the cluster predictions for this object type
-            preds = -np.ones(num_points)
             if self.per_object:
-                shapes = -np.full(num_points, LOWES_SHP)
                 if not self.use_objects:
                     # Use clusters directly from the full chain output
-                    num_reco = len(data[f'{obj_type}_clusts'])
-                    for i, index in enumerate(data[f'{obj_type}_clusts']):
-                        preds[index] = i
-                        shapes[index] = data[f'{obj_type}_shapes'][i]
+                    clusts = data[f'{obj_type}_clusts']
+                    num_reco = len(clusts)
+                    preds = self.scatter_labels(num_points, clusts)
+                    shapes = self.scatter_labels(
+                            num_points, clusts, data[f'{obj_type}_shapes'],
+                            default=-LOWES_SHP)
 
                 else:
                     # Use clusters from the object indexes
-                    num_reco = len(data[f'reco_{obj_type}s'])
-                    for i, obj in enumerate(data[f'reco_{obj_type}s']):
-                        preds[obj.index] = i
-                        if obj_type != 'interaction':
-                            shapes[obj.index] = obj.shape
+                    reco_objs = data[f'reco_{obj_type}s']
+                    num_reco = len(reco_objs)
+                    index_list = [obj.index for obj in reco_objs]
+                    preds = self.scatter_labels(num_points, index_list)
+                    shapes = -np.full(num_points, LOWES_SHP)
+                    if obj_type != 'interaction':
+                        shapes = self.scatter_labels(
+                                num_points, index_list,
+                                [obj.shape for obj in reco_objs],
+                                default=-LOWES_SHP)
 
             else:
                 num_reco = len(data['clusts'])
-                for i, index in enumerate(data['clusts']):
-                    preds[index] = data['group_pred'][i]
+                preds = self.scatter_labels(
+                        num_points, data['clusts'], data['group_pred'])
 
             # Evaluate clustering metrics
             row_dict = {'num_points': num_points, 'num_truth': num_truth,
@@ -176,3 +181,37 @@ class ClusterAna(AnaBase):
                                 labels[shape_index], preds[shape_index])
 
             self.append(obj_type, **row_dict)
+
+    @staticmethod
+    def scatter_labels(num_points, index_list, values=None, default=-1):
+        """Assigns a label to each point from a list of point clusters.
+
+        All the clusters are assigned at once, by scattering the label of each
+        cluster into the points that compose it. If clusters overlap, the last
+        cluster takes precedence.
+
+        Parameters
+        ----------
+        num_points : int
+            Number of points in the image
+        index_list : List[np.ndarray]
+            (C) List of point indexes, one per cluster
+        values : np.ndarray, optional
+            (C) Label of each cluster. If not specified, use the cluster index
+        default : float, default -1
+            Label of points which do not belong to any cluster
+
+        Returns
+        -------
+        np.ndarray
+            (N) Label of each point
+        """
+        labels = np.full(num_points, default, dtype=float)
+        if len(index_list):
+            counts = [len(index) for index in index_list]
+            if values is None:
+                values = np.arange(len(index_list))
+            index = np.concatenate(index_list).astype(np.int64, copy=False)
+            labels[index] = np.repeat(np.asarray(values), counts)
+
+        return labels
@@ -195,6 +195,34 @@ class BuilderBase(ABC):
 
         return ObjectList(obj_list, default)
 
+    @staticmethod
+    def concat_index(index_list):
+        """Concatenates a list of object indexes into a single index.
+
+        This allows to gather the long-form attributes of all objects in an
+        entry at once and to give each object a view into the shared buffer.
+
+        Parameters
+        ----------
+        index_list : List[np.ndarray]
+            (P) List of voxel indexes, one per object
+
+        Returns
+        -------
+        index : np.ndarray
+            (M) Concatenated voxel indexes
+        offsets : np.ndarray
+            (P + 1) Offsets of each object in the concatenated index
+        """
+        offsets = np.zeros(len(index_list) + 1, dtype=np.int64)
+        if not len(index_list):
+            return np.empty(0, dtype=np.int64), offsets
+
+        np.cumsum([len(index) for index in index_list], out=offsets[1:])
+        index = np.concatenate(index_list).astype(np.int64, copy=False)
+
+        return index, offsets
+
     @abstractmethod
     def build_reco(self, data):
         """Place-holder for a method used to build reconstructed objects.
@@ -6,6 +6,7 @@ from scipy.special import softmax
 
 from spine.data.out import RecoParticle, TruthParticle
 from spine.utils.globals import COORD_COLS, VALUE_COL, GROUP_COL, TRACK_SHP
+from spine.utils.particles import get_query_index
 
 from .base import BuilderBase
 
@@ -97,47 +98,69 @@ class ParticleBuilder(BuilderBase):
         List[RecoParticle]
             List of constructed reconstructed particle instances
         """
-        # Convert the logits to softmax scores and the scores to a prediction
+        # Convert the logits to softmax scores and the scores to a prediction.
+        # Labels are stored as 64-bit integers (like the defaults of the data
+        # class) and scores as 32-bit floats.
         pid_scores = softmax(particle_node_type_pred, axis=1)
-        primary_scores = softmax(particle_node_primary_pred, axis=1)
-        pid_pred = np.argmax(pid_scores, axis=1)
+        primary_scores = softmax(particle_node_primary_pred, axis=1).astype(
+                np.float32, copy=False)
+        pid_pred = np.argmax(pid_scores, axis=1).astype(np.int64)
         primary_pred = np.argmax(primary_scores, axis=1)
+        group_pred = np.asarray(particle_group_pred, dtype=np.int64)
+        orient_pred = None
         if particle_node_orient_pred is not None:
             orient_pred = np.argmax(particle_node_orient_pred, axis=1)
 
+        # Store the PID scores of all particles in a single contiguous array
+        # which preserves the default size. Each particle gets a row view.
+        num_classes = RecoParticle._fixed_length_attrs['pid_scores']
+        pid_scores_all = np.zeros(
+                (len(particle_clusts), num_classes), dtype=np.float32)
+        pid_scores_all[:, :pid_scores.shape[1]] = pid_scores
+
+        # Pack the start/end points and directions of all particles in a single
+        # (P, 4, 3) array. End points are only meaningful for tracks. If the
+        # orientation prediction is provided, use it to flip tracks.
+        track_mask = particle_shapes == TRACK_SHP
+        endpoints = np.full(
+                (len(particle_clusts), 4, 3), -np.inf, dtype=np.float32)
+        endpoints[:, 0] = particle_start_points
+        endpoints[track_mask, 1] = particle_end_points[track_mask]
+        if orient_pred is not None:
+            flip_index = np.where(track_mask & (orient_pred == 0))[0]
+            endpoints[flip_index, :2] = endpoints[flip_index, 1::-1]
+
+        # Gather the long-form attributes of all particles at once
+        index_all, offsets = self.concat_index(particle_clusts)
+        points_all = points[index_all]
+        depositions_all = depositions[index_all]
+        if sources is not None:
+            sources_all = sources[index_all]
+
         # Loop over the particle instances
         reco_particles = []
         for i, index in enumerate(particle_clusts):
             # Initialize
+            start, end = offsets[i], offsets[i+1]
             particle = RecoParticle(
                     id=i,
-                    interaction_id=particle_group_pred[i],
+                    interaction_id=group_pred[i],
                     shape=particle_shapes[i],
                     index=index,
-                    points=points[index],
-                    depositions=depositions[index],
+                    points=points_all[start:end],
+                    depositions=depositions_all[start:end],
                     pid=pid_pred[i],
+                    pid_scores=pid_scores_all[i],
                     primary_scores=primary_scores[i],
-                    is_primary=bool(primary_pred[i]))
-
-            # Set the PID scores without modifying the default size
-            particle.pid_scores[:len(pid_scores[i])] = pid_scores[i]
-            particle.pid_scores[len(pid_scores[i]):] = 0.
-
-            # Set the end points
-            particle.start_point = particle_start_points[i]
-            if particle.shape == TRACK_SHP:
-                particle.end_point = particle_end_points[i]
-
-            # If the orientation prediction is provided, use it
-            if orient_pred is not None and not orient_pred[i]:
-                if particle.shape == TRACK_SHP:
-                    particle.start_point, particle.end_point = (
-                            particle.end_point, particle.start_point)
+                    is_primary=bool(primary_pred[i]),
+                    start_point=endpoints[i, 0],
+                    end_point=endpoints[i, 1],
+                    start_dir=endpoints[i, 2],
+                    end_dir=endpoints[i, 3])
 
             # Add optional arguments
             if sources is not None:
-                particle.sources = sources[index]
+                particle.sources = sources_all[start:end]
 
             # Append
             reco_particles.append(particle)
@@ -202,6 +225,16 @@ class ParticleBuilder(BuilderBase):
         truth_particles = []
         unique_group_ids = np.unique(label_tensor[:, GROUP_COL]).astype(int)
         valid_group_ids = unique_group_ids[unique_group_ids > -1]
+
+        # Partition each label tensor by group ID once
+        group_index = get_query_index(
+                label_tensor[:, GROUP_COL], valid_group_ids)
+        group_index_adapt = get_query_index(
+                label_adapt_tensor[:, GROUP_COL], valid_group_ids)
+        if label_g4_tensor is not None:
+            group_index_g4 = get_query_index(
+                    label_g4_tensor[:, GROUP_COL], valid_group_ids)
+
         for i, group_id in enumerate(valid_group_ids):
             # Load the MC particle information
             assert group_id < len(particles), (
@@ -222,7 +255,7 @@ class ParticleBuilder(BuilderBase):
                 particle.end_point = particle.last_step
 
             # Update the particle with its long-form attributes
-            index = np.where(label_tensor[:, GROUP_COL] == group_id)[0]
+            index = group_index[i]
             particle.index = index
             particle.points = points_label[index]
             particle.depositions = depositions_label[index]
@@ -231,8 +264,7 @@ class ParticleBuilder(BuilderBase):
             if sources_label is not None:
                 particle.sources = sources_label[index]
 
-            index_adapt = np.where(
-                    label_adapt_tensor[:, GROUP_COL] == group_id)[0]
+            index_adapt = group_index_adapt[i]
             particle.index_adapt = index_adapt
             particle.points_adapt = points[index_adapt]
             particle.depositions_adapt = depositions[index_adapt]
@@ -240,8 +272,7 @@ class ParticleBuilder(BuilderBase):
                 particle.sources_adapt = sources[index_adapt]
 
             if label_g4_tensor is not None:
-                index_g4 = np.where(
-                        label_g4_tensor[:, GROUP_COL] == group_id)[0]
+                index_g4 = group_index_g4[i]
                 particle.index_g4 = index_g4
                 particle.points_g4 = points_g4[index_g4]
                 particle.depositions_g4 = depositions_g4[index_g4]
@@ -280,6 +311,14 @@ class ParticleBuilder(BuilderBase):
         List[RecoParticle]
             List of restored reconstructed particle instances
         """
+        # Gather the long-form attributes of all particles at once
+        index_all, offsets = self.concat_index(
+                [particle.index for particle in reco_particles])
+        points_all = points[index_all]
+        depositions_all = depositions[index_all]
+        if sources is not None:
+            sources_all = sources[index_all]
+
         # Loop over the dictionaries
         for i, particle in enumerate(reco_particles):
             # Check that the particle ID checks out
@@ -287,10 +326,11 @@ class ParticleBuilder(BuilderBase):
                     "The ordering of the stored particles is wrong.")
 
             # Update the particle with its long-form attributes
-            particle.points = points[particle.index]
-            particle.depositions = depositions[particle.index]
+            start, end = offsets[i], offsets[i+1]
+            particle.points = points_all[start:end]
+            particle.depositions = depositions_all[start:end]
             if sources is not None:
-                particle.sources = sources[particle.index]
+                particle.sources = sources_all[start:end]
 
         return reco_particles
 
@@ -1,10 +1,34 @@
 """Module with a parent class of all data structures."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
 import numpy as np
 
 
+def empty_array(dtype, width=None):
+    """Builds an empty array of a given type and width.
+
+    A new array is built on each call, such that in-place updates of the
+    default attributes of an object never affect any other object. Empty
+    arrays hold no data, so this costs next to nothing.
+
+    Parameters
+    ----------
+    dtype : type
+        Data type of the array
+    width : int, optional
+        Width of the array, if it is two-dimensional
+
+    Returns
+    -------
+    np.ndarray
+        (0) or (0, width) empty array
+    """
+    shape = (0,) if width is None else (0, width)
+
+    return np.empty(shape, dtype=dtype)
+
+
 @dataclass(eq=False)
 class DataBase:
     """Base class of all data structures.
@@ -59,10 +83,10 @@ class DataBase:
         for attr, dtype in self._var_length_attrs.items():
             if getattr(self, attr) is None:
                 if not isinstance(dtype, tuple):
-                    setattr(self, attr, np.empty(0, dtype=dtype))
+                    setattr(self, attr, empty_array(dtype))
                 else:
                     width, dtype = dtype
-                    setattr(self, attr, np.empty((0, width), dtype=dtype))
+                    setattr(self, attr, empty_array(dtype, width))
 
         # Provide default values to the fixed-length array attributes
         for attr, size in self._fixed_length_attrs.items():
@@ -119,7 +143,8 @@ class DataBase:
         return True
 
     def set_precision(self, precision):
-        """Casts all the vector attributes to a different precision.
+        """Casts all the floating point vector attributes to a different
+        precision.
 
         Parameters
         ----------
@@ -128,8 +153,13 @@ class DataBase:
         """
         assert precision in [2, 4, 8], (
                 "Set the vector attribute precision for this object.")
-        for attr in self.fixed_length_attrs + self.variable_length_attrs:
+        for attr in [*self.fixed_length_attrs, *self.var_length_attrs]:
+            # Only floating point arrays can be recast. Integer arrays hold
+            # indexes and IDs, which could overflow at lower precision.
             val = getattr(self, attr)
+            if val.dtype.kind != 'f':
+                continue
+
             dtype = f'{val.dtype.str[:-1]}{precision}'
             setattr(self, attr, val.astype(dtype))
 
@@ -155,10 +185,15 @@ class DataBase:
             List of attribute names to include in the dictionary. If not
             specified, all the keys are included.
         """
-        # Loop over the attributes of the data class
+        # Loop over the attributes of the data class. The values are fetched
+        # directly, rather than through `as_dict`, to avoid deep-copying the
+        # (potentially large) array attributes of each object.
         scalar_dict, found = {}, []
-        for attr, value in self.as_dict().items():
+        for field in fields(self):
             # If the attribute is not requested, skip
+            attr = field.name
+            if attr in self._skip_attrs:
+                continue
             if attrs is not None and attr not in attrs:
                 continue
             else:
@@ -166,10 +201,11 @@ class DataBase:
 
             # If the attribute is long-form attribute, skip it
             if (attr not in self._binarize_attrs and
-                (attr in self._skip_attrs or attr in self._var_length_attrs)):
+                attr in self._var_length_attrs):
                 continue
 
             # Dispatch
+            value = getattr(self, attr)
             if np.isscalar(value):
                 # If the attribute is a scalar, store as is
                 scalar_dict[attr] = value
@@ -221,7 +257,7 @@ class DataBase:
         Dict[str, type]
             Dictionary which maps variable-length attributes onto their type
         """
-        return self._fixed_length_attrs
+        return self._var_length_attrs
 
     @property
     def enum_attrs(self):
@@ -298,3 +334,32 @@ class PosDataBase(DataBase):
         self.units = 'px'
         for attr in self._pos_attrs:
             setattr(self, attr, meta.to_px(getattr(self, attr)))
+
+    @classmethod
+    def batch_to_px(cls, objects, meta):
+        """Converts the coordinates of the positional attributes of a list
+        of objects to pixel, with a single call to the metadata conversion.
+
+        Parameters
+        ----------
+        objects : List[PosDataBase]
+            (N) List of objects of this class
+        meta : Meta
+            Metadata information about the rasterized image
+        """
+        # If there are no objects, nothing to do
+        if not len(objects):
+            return
+
+        # Convert the (N, A, 3) array of positions at once
+        positions = np.array(
+                [[getattr(obj, attr) for attr in cls._pos_attrs]
+                 for obj in objects], dtype=np.float32)
+        positions = meta.to_px(positions)
+
+        # Update the objects
+        for i, obj in enumerate(objects):
+            assert obj.units != 'px', "Units already expressed in pixels"
+            obj.units = 'px'
+            for j, attr in enumerate(cls._pos_attrs):
+                setattr(obj, attr, positions[i, j])
@@ -92,9 +92,8 @@ class CRTHit(PosDataBase):
             CRT hit object
         """
         # Get the physical center and width of the CRT hit
-        axes = ['x', 'y', 'z']
-        center = np.array([getattr(crthit, f'{a}_pos')() for a in axes])
-        width = np.array([getattr(crthit, f'{a}_err')() for a in axes])
+        center = np.array([crthit.x_pos(), crthit.y_pos(), crthit.z_pos()])
+        width = np.array([crthit.x_err(), crthit.y_err(), crthit.z_err()])
 
         # Convert the FEB address to a list of bytes
         feb_id = np.array([ord(c) for c in crthit.feb_id()], dtype=np.ubyte)
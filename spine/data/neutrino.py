@@ -121,6 +121,18 @@ class Neutrino(PosDataBase):
     # String attributes
     _str_attrs = ['creation_process']
 
+    # Scalar attributes to load from LArCV neutrino objects
+    _larcv_attrs = ('id', 'interaction_id', 'mct_index', 'nu_track_id',
+                    'lepton_track_id', 'pdg_code', 'lepton_pdg_code',
+                    'current_type', 'interaction_mode', 'interaction_type',
+                    'target', 'nucleon', 'quark', 'energy_init',
+                    'hadronic_invariant_mass', 'bjorken_x', 'inelasticity',
+                    'momentum_transfer', 'momentum_transfer_mag',
+                    'energy_transfer', 'lepton_p', 'theta', 'creation_process')
+
+    # Cache of attribute getters, one set per LArCV neutrino class
+    _larcv_getters = {}
+
     @classmethod
     def from_larcv(cls, neutrino):
         """Builds and returns a Neutrino object from a LArCV Neutrino object.
@@ -135,41 +147,61 @@ class Neutrino(PosDataBase):
         Neutrino
             Neutrino object
         """
-        # Initialize the dictionary to initialize the object with
-        obj_dict = {}
-
         # Load the scalar attributes
-        for key in ['id', 'interaction_id', 'mct_index', 'nu_track_id',
-                    'lepton_track_id', 'pdg_code', 'lepton_pdg_code',
-                    'current_type', 'interaction_mode', 'interaction_type',
-                    'target', 'nucleon', 'quark', 'energy_init',
-                    'hadronic_invariant_mass', 'bjorken_x', 'inelasticity',
-                    'momentum_transfer', 'momentum_transfer_mag',
-                    'energy_transfer', 'lepton_p', 'theta', 'creation_process']:
-            if not hasattr(neutrino, key):
-                warn(f"The LArCV Neutrino object is missing the {key} "
-                      "attribute. It will miss from the Neutrino object.")
-                continue
-            if key != 'nu_track_id':
-                obj_dict[key] = getattr(neutrino, key)()
-            else:
-                obj_dict['track_id'] = getattr(neutrino, key)()
+        getters, mom_getters = cls.larcv_getters(type(neutrino))
+        obj_dict = {key: getter(neutrino) for key, getter in getters}
 
         # Load the positional attribute
-        pos_attrs = ['x', 'y', 'z']
         for key in cls._pos_attrs:
             vector = getattr(neutrino, key)()
-            obj_dict[key] = np.asarray(
-                    [getattr(vector, a)() for a in pos_attrs], dtype=np.float32)
+            obj_dict[key] = np.array(
+                    (vector.x(), vector.y(), vector.z()), dtype=np.float32)
 
         # Load the momentum attribute (special care needed)
-        mom_attrs = ['px', 'py', 'pz']
-        if not hasattr(neutrino, 'momentum'):
-            warn("The LArCV Neutrino object is missing the momentum "
-                 "attribute. It will miss from the Neutrino object.")
-        else:
-            obj_dict['momentum'] = np.asarray(
-                    [getattr(neutrino, a)() for a in mom_attrs],
+        if mom_getters is not None:
+            obj_dict['momentum'] = np.array(
+                    [getter(neutrino) for getter in mom_getters],
                     dtype=np.float32)
 
         return cls(**obj_dict)
+
+    @classmethod
+    def larcv_getters(cls, larcv_cls):
+        """Fetches the list of attribute getters of a LArCV neutrino class,
+        resolved once per class.
+
+        Parameters
+        ----------
+        larcv_cls : type
+            LArCV-format neutrino class
+
+        Returns
+        -------
+        Tuple[Tuple[str, callable]]
+            List of (attribute name, unbound getter) pairs
+        Tuple[callable]
+            Getters of the momentum components, `None` if the class does not
+            provide the momentum
+        """
+        if larcv_cls not in cls._larcv_getters:
+            getters = []
+            for key in cls._larcv_attrs:
+                getter = getattr(larcv_cls, key, None)
+                if getter is None:
+                    warn(f"The LArCV Neutrino object is missing the {key} "
+                          "attribute. It will miss from the Neutrino object.")
+                    continue
+                name = key if key != 'nu_track_id' else 'track_id'
+                getters.append((name, getter))
+
+            mom_getters = None
+            if not hasattr(larcv_cls, 'momentum'):
+                warn("The LArCV Neutrino object is missing the momentum "
+                     "attribute. It will miss from the Neutrino object.")
+            else:
+                mom_getters = tuple(
+                        getattr(larcv_cls, a) for a in ('px', 'py', 'pz'))
+
+            cls._larcv_getters[larcv_cls] = (tuple(getters), mom_getters)
+
+        return cls._larcv_getters[larcv_cls]
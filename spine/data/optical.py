@@ -86,12 +86,14 @@ class Flash(PosDataBase):
             Flash object
         """
         # Get the physical center and width of the flash
-        axes = ['x', 'y', 'z']
-        center = np.array([getattr(flash, f'{a}Center')() for a in axes])
-        width = np.array([getattr(flash, f'{a}Width')() for a in axes])
+        center = np.array(
+                [flash.xCenter(), flash.yCenter(), flash.zCenter()])
+        width = np.array([flash.xWidth(), flash.yWidth(), flash.zWidth()])
 
         # Get the number of PEs per optical channel
-        pe_per_ch = np.array(list(flash.PEPerOpDet()), dtype=np.float32)
+        pe_per_op = flash.PEPerOpDet()
+        pe_per_ch = np.fromiter(
+                pe_per_op, dtype=np.float32, count=pe_per_op.size())
 
         return cls(id=flash.id(), frame=flash.frame(),
                    in_beam_frame=flash.inBeamFrame(),
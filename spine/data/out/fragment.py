@@ -77,7 +77,7 @@ class FragmentBase:
         str
             Basic information about the fragment properties
         """
-        shape_label = SHAPE_LABELS[self.shape]
+        shape_label = SHAPE_LABELS.get(self.shape, SHAPE_LABELS[-1])
         match = self.match_ids[0] if len(self.match_ids) > 0 else -1
         return (f"Fragment(ID: {self.id:<3} | Shape: {shape_label:<11} "
                 f"| Primary: {self.is_primary:<2} "
@@ -126,12 +126,11 @@ class InteractionBase:
         np.ndarray
             (P) Number of particles of each PID
         """
-        counts = np.zeros(len(PID_LABELS) - 1, dtype=int)
-        for part in self.particles:
-            if part.pid > -1 and part.is_valid:
-                counts[part.pid] += 1
+        pids = [part.pid for part in self.particles
+                if part.pid > -1 and part.is_valid]
 
-        return counts
+        return np.bincount(
+                np.asarray(pids, dtype=int), minlength=len(PID_LABELS) - 1)
 
     @particle_counts.setter
     def particle_counts(self, particle_counts):
@@ -146,12 +145,11 @@ class InteractionBase:
         np.ndarray
             (P) Number of primary particles of each PID
         """
-        counts = np.zeros(len(PID_LABELS) - 1, dtype=int)
-        for part in self.particles:
-            if part.pid > -1 and part.is_primary and part.is_valid:
-                counts[part.pid] += 1
+        pids = [part.pid for part in self.particles
+                if part.pid > -1 and part.is_primary and part.is_valid]
 
-        return counts
+        return np.bincount(
+                np.asarray(pids, dtype=int), minlength=len(PID_LABELS) - 1)
 
     @primary_particle_counts.setter
     def primary_particle_counts(self, primary_particle_counts):
@@ -166,12 +164,10 @@ class InteractionBase:
         str
             String listing the number of primary particles in this interaction
         """
-        topology = ''
-        for i, count in enumerate(self.primary_particle_counts):
-            if count > 0:
-                topology += f'{count}{PID_TAGS[i]}'
+        counts = self.primary_particle_counts
 
-        return topology
+        return ''.join(
+                f'{counts[i]}{PID_TAGS[i]}' for i in np.flatnonzero(counts))
 
     @topology.setter
     def topology(self, topology):
@@ -129,7 +129,7 @@ class ParticleBase:
         str
             Basic information about the particle properties
         """
-        pid_label = PID_LABELS[self.pid]
+        pid_label = PID_LABELS.get(self.pid, PID_LABELS[-1])
         match = self.match_ids[0] if len(self.match_ids) > 0 else -1
         return (f"Particle(ID: {self.id:<3} | PID: {pid_label:<8} "
                 f"| Primary: {self.is_primary:<2} "
@@ -269,13 +269,16 @@ class RecoParticle(ParticleBase, RecoBase):
         self.start_dir = dirs_i[max_i]
         self.end_dir = dirs_j[max_j]
 
-        # If one of the two particles is a primary, the new one is
+        # If one of the two particles is a primary, the new one is. Carry the
+        # primary prediction along with the scores it derives from.
         if other.primary_scores[-1] > self.primary_scores[-1]:
             self.primary_scores = other.primary_scores
+            self.is_primary = other.is_primary
 
         # For PID, pick the most confident prediction (could be better...)
-        if np.max(other.pid_scores) > np.max(self.pid_scores):
+        if other.pid_scores.max() > self.pid_scores.max():
             self.pid_scores = other.pid_scores
+            self.pid = other.pid
 
     @property
     def mass(self):
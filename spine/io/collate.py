@@ -115,16 +115,14 @@ class CollateAll:
                 # are provided, along with the metadata information
                 if not self.split:
                     # If not split, simply stack everything
-                    voxels    = np.vstack([sample[key][0] for sample in batch])
-                    features  = np.vstack([sample[key][1] for sample in batch])
-                    counts    = [len(sample[key][0]) for sample in batch]
-                    batch_ids = np.repeat(
-                            np.arange(batch_size, dtype=voxels.dtype), counts)
+                    voxels_v   = [sample[key][0] for sample in batch]
+                    features_v = [sample[key][1] for sample in batch]
+                    counts     = [len(voxels) for voxels in voxels_v]
 
                 else:
                     # If split, must shift the voxel coordinates and create
                     # one batch ID per [batch, volume] pair
-                    voxels_v, features_v, batch_ids_v = [], [], []
+                    voxels_v, features_v = [], []
                     counts = np.empty(
                             batch_size*self.geo.num_modules, dtype=np.int64)
                     for s, sample in enumerate(batch):
@@ -152,20 +150,28 @@ class CollateAll:
                             voxels_v.append(voxels[module_index])
                             features_v.append(features[module_index])
                             idx = self.geo.num_modules * s + m
-                            batch_ids_v.append(np.full(len(module_index),
-                                               idx, dtype=voxels.dtype))
                             counts[idx] = len(module_index)
 
-                    voxels = np.vstack(voxels_v)
-                    features = np.vstack(features_v)
-                    batch_ids = np.concatenate(batch_ids_v)
-
-                # Stack the coordinates with the features
-                tensor = np.hstack([batch_ids[:, None], voxels, features])
-                coord_cols = np.arange(1, 1+voxels.shape[1])
+                # Stack the batch IDs, coordinates and features, filling
+                # each block of the output tensor in place
+                num_coords = voxels_v[0].shape[1]
+                num_features = features_v[0].shape[1]
+                tensor = np.empty(
+                        (np.sum(counts), 1 + num_coords + num_features),
+                        dtype=features_v[0].dtype)
+                offset = 0
+                for b, (voxels, features) in enumerate(
+                        zip(voxels_v, features_v)):
+                    block = tensor[offset:offset + len(voxels)]
+                    block[:, 0] = b
+                    block[:, 1:1 + num_coords] = voxels
+                    block[:, 1 + num_coords:] = features
+                    offset += len(voxels)
+
+                coord_cols = np.arange(1, 1 + num_coords)
                 data[key] = TensorBatch(
-                        tensor.astype(features.dtype), counts,
-                        has_batch_col=True, coord_cols=coord_cols)
+                        tensor, counts, has_batch_col=True,
+                        coord_cols=coord_cols)
 
             elif isinstance(ref_obj, tuple) and len(ref_obj) == 2:
                 # Case where an index and an offset is provided per entry.
@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class ParserBase(ABC):
     """Abstract parent class of all parser classes.
@@ -76,24 +78,72 @@ class ParserBase(ABC):
         object
             Output(s) of the parser function
         """
-        # Build the input to the parser function
-        data_dict = {}
-        for key, value in self.data_map.items():
-            if isinstance(value, str):
-                if value not in trees:
-                    raise ValueError(
-                            f"Must provide {value} for parser `{self.name}`.")
-                data_dict[key] = trees[value]
-
-            elif isinstance(value, list):
-                for v in value:
-                    if v not in trees:
-                        raise ValueError(
-                                f"Must provide {v} for parser `{self.name}`.")
-                data_dict[key] = [trees[v] for v in value]
+        # Build the input to the parser function. The presence of the
+        # data products is only checked if a lookup fails
+        try:
+            data_dict = {}
+            for key, value in self.data_map.items():
+                if isinstance(value, str):
+                    data_dict[key] = trees[value]
+                elif isinstance(value, list):
+                    data_dict[key] = [trees[v] for v in value]
+
+        except KeyError as err:
+            raise ValueError(
+                    f"Must provide {err.args[0]} for parser "
+                    f"`{self.name}`.") from err
 
         return data_dict
 
+    def empty_features(self, num_points, num_features):
+        """Allocates a feature tensor to be filled in place, one column at a
+        time, by the LArCV point cloud filling functions.
+
+        The tensor is stored in column-major order, such that each of its
+        (N, 1) column views is contiguous in memory and can be filled
+        directly, without an extra concatenation step.
+
+        Parameters
+        ----------
+        num_points : int
+            Number of points in the tensor
+        num_features : int
+            Number of features in the tensor
+
+        Returns
+        -------
+        np.ndarray
+            (N, C) Uninitialized feature tensor
+        """
+        return np.empty((num_features, num_points), dtype=self.ftype).T
+
+    @staticmethod
+    def cluster_offsets(clusters_v):
+        """Fetches the number of voxels in each cluster and the offsets
+        of each cluster in the concatenated voxel tensor.
+
+        Parameters
+        ----------
+        clusters_v : List[Union[larcv.ClusterPixel2D, larcv.VoxelSet]]
+            List of clusters
+
+        Returns
+        -------
+        sizes : np.ndarray
+            (C) Number of voxels in each cluster
+        offsets : np.ndarray
+            (C + 1) Offset of each cluster in the concatenated tensor
+        """
+        num_clusters = clusters_v.size()
+        sizes = np.empty(num_clusters, dtype=np.int64)
+        for i in range(num_clusters):
+            sizes[i] = clusters_v[i].as_vector().size()
+
+        offsets = np.zeros(num_clusters + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+
+        return sizes, offsets
+
     @abstractmethod
     def __call__(self, trees):
         """Parse one entry.
@@ -40,152 +40,235 @@ def clean_sparse_data(cluster_voxels, cluster_data, sparse_voxels):
     cluster_data: np.ndarray
         (M, F) Ordered and filtered set of voxel values
     """
+    # If possible, pack the coordinates of each voxel into a single integer
+    # key, use it to sort, deduplicate and filter the voxels in one go
+    cluster_keys, sparse_keys = voxel_keys(cluster_voxels, sparse_voxels)
+    if cluster_keys is not None:
+        # Remove voxels not present in the sparse matrix first, so that
+        # the sort only involves the voxels that can be kept
+        index = np.where(np.isin(cluster_keys, sparse_keys))[0]
+        cluster_keys = cluster_keys[index]
+
+        # Order voxels by key, then shape precedence (last voxel first)
+        ranks = shape_ranks(cluster_data[index, SHAPE_COL])
+        order = np.lexsort((-index, ranks, cluster_keys))
+
+        # Keep the first voxel of each key, i.e. the one with the highest
+        # precedence among the duplicates
+        sorted_keys = cluster_keys[order]
+        first_mask = np.ones(len(sorted_keys), dtype=bool)
+        first_mask[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        index = index[order[first_mask]]
+
+        return cluster_voxels[index], cluster_data[index]
+
     # Lexicographically sort cluster and sparse data
-    perm = np.lexsort(cluster_voxels.T)
+    perm = lexsort_voxels(cluster_voxels)
     cluster_voxels = cluster_voxels[perm]
     cluster_data = cluster_data[perm]
 
-    perm = np.lexsort(sparse_voxels.T)
+    perm = lexsort_voxels(sparse_voxels)
     sparse_voxels = sparse_voxels[perm]
 
-    # Remove duplicates
-    duplicate_mask = filter_duplicate_voxels_ref(
-            cluster_voxels, cluster_data[:, SHAPE_COL],
-            nb.typed.List(SHAPE_PREC))
-    duplicate_index = np.where(duplicate_mask)[0]
-    cluster_voxels = cluster_voxels[duplicate_index]
-    cluster_data = cluster_data[duplicate_index]
-
-    # Remove voxels not present in the sparse matrix
-    non_ref_mask = filter_voxels_ref(cluster_voxels, sparse_voxels)
-    non_ref_index = np.where(non_ref_mask)[0]
-    cluster_voxels = cluster_voxels[non_ref_index]
-    cluster_data = cluster_data[non_ref_index]
+    # Remove duplicates and voxels not present in the sparse matrix
+    # in a single pass over both sorted tensors
+    ranks = shape_ranks(cluster_data[:, SHAPE_COL])
+    mask = filter_voxels_merge(cluster_voxels, ranks, sparse_voxels)
+    cluster_voxels = cluster_voxels[mask]
+    cluster_data = cluster_data[mask]
 
     return cluster_voxels, cluster_data
 
 
-@nb.njit(cache=True)
-def filter_duplicate_voxels(data: nb.int32[:,:]) -> nb.boolean[:]:
-    """Returns an array with no duplicate voxel coordinates.
+def voxel_keys(*voxel_list):
+    """Packs the coordinates of each voxel into a single integer key.
 
-    If there are multiple voxels with the same coordinates, this algorithm
-    simply picks the first one.
+    The keys share the same packing for all the input tensors and they sort
+    in the same order as `np.lexsort(voxels.T)`, i.e. with the last axis
+    as the primary sort key.
 
     Parameters
     ----------
-    data: np.ndarray
-        (N, 3) Lexicographically sorted matrix of voxel coordinates
+    *voxel_list : List[np.ndarray]
+        (N, D) Matrices of voxel coordinates
+
+    Returns
+    -------
+    List[np.ndarray]
+        (N) One array of keys per tensor. If the tensors are empty or the
+        coordinates span too large a range to fit in 63 bits, each entry
+        is `None` instead.
+    """
+    # If any of the tensors is empty, nothing to do
+    if any(len(voxels) == 0 for voxels in voxel_list):
+        return [None] * len(voxel_list)
+
+    # Define the number of bits needed to encode each axis
+    lower = np.min([np.min(voxels, axis=0) for voxels in voxel_list], axis=0)
+    upper = np.max([np.max(voxels, axis=0) for voxels in voxel_list], axis=0)
+    spans = (upper - lower).astype(np.int64) + 1
+    bits = np.ceil(np.log2(spans)).astype(np.int64)
+    if np.sum(bits) > 63:
+        return [None] * len(voxel_list)
+
+    # Pack the coordinates, the last axis occupies the most significant bits
+    shifts = np.concatenate([[0], np.cumsum(bits)[:-1]])
+    keys = []
+    for voxels in voxel_list:
+        offsets = voxels.astype(np.int64) - lower.astype(np.int64)
+        keys.append(np.bitwise_or.reduce(offsets << shifts, axis=1))
+
+    return keys
+
+
+def shape_ranks(shapes):
+    """Converts shape labels into their rank in the order of precedence.
+
+    Parameters
+    ----------
+    shapes : np.ndarray
+        (N) Array of shape labels
 
     Returns
     -------
     np.ndarray
-        (N', 3) Matrix that does not contain duplicate voxel coordinates
+        (N) Rank of each shape label in `SHAPE_PREC`. Shapes which do not
+        appear in the precedence list come last.
     """
-    # For each voxel, check if the next one shares its coordinates
-    n = data.shape[0]
-    ret = np.ones(n, dtype=np.bool_)
-    for i in range(1, n):
-        if np.all(data[i-1] == data[i]):
-            ret[i-1] = False
+    ranks = np.full(len(shapes), len(SHAPE_PREC), dtype=np.int64)
+    for rank, shape in enumerate(SHAPE_PREC):
+        ranks[shapes == shape] = rank
 
-    return ret
+    return ranks
 
 
 @nb.njit(cache=True)
-def filter_duplicate_voxels_ref(data: nb.int32[:,:],
-                                reference: nb.int32[:],
-                                precedence: nb.types.List(nb.int32)) -> nb.boolean[:]:
-    """Returns an array with no duplicate voxel coordinates.
+def lexsort_voxels(voxels: nb.int32[:,:]) -> nb.int64[:]:
+    """Finds the permutation which lexicographically sorts a set of voxels,
+    with the last axis as the primary sort key (as `np.lexsort(voxels.T)`).
 
-    If there are multiple voxels with the same coordinates, this algorithm
-    picks the voxel which has the shape label that comes first in order of
-    precedence. If multiple voxels with the same precedence index share voxel
-    coordinates, the first one is picked.
+    This uses a least-significant digit radix sort, i.e. a sequence of stable
+    counting sorts on 16-bit digits of each axis, from the first axis to the
+    last. This is used when the voxel coordinates are too spread out to be
+    packed into a single integer key.
 
     Parameters
     ----------
-    data: np.ndarray
-        (N, 3) Lexicographically sorted matrix of voxel coordinates
-    reference: np.ndarray
-        (N) Array of values which have to follow the precedence order
-    precedence: list
-        (C) Array of classes in the reference array, ordered by precedence
+    voxels : np.ndarray
+        (N, 3) Matrix of voxel coordinates
 
     Returns
     -------
     np.ndarray
-        (N', 3) Matrix that does not contain duplicate voxel coordinates
+        (N) Permutation which sorts the voxels
     """
-    # Find all the voxels which are duplicated and organize them in groups
-    n = data.shape[0]
-    ret = np.ones(n, dtype=np.bool_)
-    temp_list = nb.typed.List.empty_list(nb.int64)
-    groups = []
-    for i in range(1, n):
-        same = np.all(data[i-1] == data[i])
-        if same:
-            if not temp_list:
-                temp_list.extend([i-1, i])
-            else:
-                temp_list.append(i)
-        if temp_list and (not same or i == n-1):
-            groups.append(temp_list)
-            temp_list = nb.typed.List.empty_list(nb.int64)
-
-    # For each group, pick the voxel with the label that comes first
-    # in order of precedence
-    for group in groups:
-        group = np.asarray(group)
-        ref = np.array([precedence.index(int(r)) for r in reference[group]])
-        args = np.argsort(-ref, kind='mergesort') # Preserve duplicate order
-        ret[group[args[:-1]]] = False
+    # Initialize the permutation and the counting sort buffers
+    n, d = voxels.shape
+    perm = np.arange(n)
+    if n == 0:
+        return perm
+
+    buffer = np.empty(n, dtype=np.int64)
+    counts = np.empty(2**16 + 1, dtype=np.int64)
+    mask = 2**16 - 1
+
+    # Loop over the axes and the digits, minor axis and digit first
+    for k in range(d):
+        col = voxels[:, k]
+        lower = np.int64(col.min())
+        span = np.int64(col.max()) - lower
+        shift = 0
+        while (span >> shift) > 0:
+            # Count the number of voxels for each digit value
+            counts[:] = 0
+            for i in range(n):
+                digit = ((np.int64(col[perm[i]]) - lower) >> shift) & mask
+                counts[digit + 1] += 1
+            for j in range(1, len(counts)):
+                counts[j] += counts[j - 1]
+
+            # Scatter the voxels in order of digit, preserving the order
+            for i in range(n):
+                digit = ((np.int64(col[perm[i]]) - lower) >> shift) & mask
+                buffer[counts[digit]] = perm[i]
+                counts[digit] += 1
+
+            perm, buffer = buffer, perm
+            shift += 16
+
+    return perm
 
-    return ret
+
+@nb.njit(cache=True)
+def voxel_less(a: nb.int32[:], b: nb.int32[:]) -> bool:
+    """Checks whether a voxel comes before another in lexicographic order,
+    with the last axis as the primary sort key (as `np.lexsort(voxels.T)`).
+
+    Parameters
+    ----------
+    a : np.ndarray
+        (3) Coordinates of the first voxel
+    b : np.ndarray
+        (3) Coordinates of the second voxel
+
+    Returns
+    -------
+    bool
+        `True` if the first voxel comes strictly before the second
+    """
+    for k in range(len(a) - 1, -1, -1):
+        if a[k] != b[k]:
+            return a[k] < b[k]
+
+    return False
 
 
 @nb.njit(cache=True)
-def filter_voxels_ref(data: nb.int32[:,:],
-                      reference: nb.int32[:,:]) -> nb.boolean[:]:
-    """Removes voxels thsat do not appear in a reference tensor.
+def filter_voxels_merge(data: nb.int32[:,:],
+                        ranks: nb.int64[:],
+                        reference: nb.int32[:,:]) -> nb.boolean[:]:
+    """Removes duplicate voxels and voxels which do not appear in a
+    reference tensor, in a single pass over both tensors.
 
-    Returns an array which does not contain any voxels which do not belong to
-    the reference array. The reference array must contain a subset of the
-    voxels in the array to be filtered.
+    If there are multiple voxels with the same coordinates, this algorithm
+    picks the voxel with the lowest rank. If multiple voxels with the same
+    rank share voxel coordinates, the last one is picked.
 
-    Assumes both arrays are lexicographically sorted, the reference matrix
-    contains no duplicates and is a subset of the matrix to be filtered.
+    Assumes both arrays are lexicographically sorted and that the reference
+    matrix contains no duplicates.
 
     Parameters
     ----------
     data: np.ndarray
         (N, 3) Lexicographically sorted matrix of voxel coordinates to filter
+    ranks: np.ndarray
+        (N) Precedence rank of each voxel (lower is kept first)
     reference: np.ndarray
-        (N, 3) Lexicographically sorted matrix of voxel coordinates to match
+        (M, 3) Lexicographically sorted matrix of voxel coordinates to match
 
     Returns
     -------
     np.ndarray
-        (N', 3) Matrix that does not contain voxels absent from
-        the reference matrix
+        (N) Mask of voxels to keep
     """
-    # Try to match each voxel in the data tensor to one in the reference tensor
+    # Walk through groups of voxels which share coordinates
     n_data, n_ref = data.shape[0], reference.shape[0]
-    d, r = 0, 0
-    ret = np.ones(n_data, dtype=np.bool_)
-    while d < n_data and r < n_ref:
-        if np.all(data[d] == reference[r]):
-            # Voxel is in both matrices
-            d += 1
+    ret = np.zeros(n_data, dtype=np.bool_)
+    start, r = 0, 0
+    while start < n_data:
+        # Pick the voxel of the group with the highest precedence
+        best, end = start, start + 1
+        while end < n_data and np.all(data[end] == data[start]):
+            if ranks[end] <= ranks[best]:
+                best = end
+            end += 1
+
+        # Keep it if it also appears in the reference tensor
+        while r < n_ref and voxel_less(reference[r], data[start]):
             r += 1
-        else:
-            # Voxel is in data, but not reference
-            ret[d] = False
-            d += 1
-
-    # Need to go through rest of data, if any is left
-    while d < n_data:
-        ret[d] = False
-        d += 1
+        if r < n_ref and np.all(reference[r] == data[start]):
+            ret[best] = True
+
+        start = end
 
     return ret
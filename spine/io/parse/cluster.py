@@ -9,6 +9,7 @@ from warnings import warn
 from collections import OrderedDict
 
 import numpy as np
+import numba as nb
 
 from spine import Meta
 from spine.utils.globals import DELTA_SHP
@@ -83,30 +84,29 @@ class Cluster2DParser(ParserBase):
         # Get the cluster from the appropriate projection
         cluster_event_p = cluster_event.cluster_pixel_2d(self.projection_id)
 
-        # Loop over clusters, store information
+        # Get the size of each cluster, check that there is something to load
         meta = cluster_event_p.meta()
-        num_clusters = cluster_event_p.size()
-        clusters_voxels, clusters_features = [], []
-        for i in range(num_clusters):
-            cluster = cluster_event_p.as_vector()[i]
-            num_points = cluster.as_vector().size()
-            if num_points > 0:
-                x = np.empty(num_points, dtype=self.itype)
-                y = np.empty(num_points, dtype=self.itype)
-                value = np.empty(num_points, dtype=self.ftype)
-                larcv.as_flat_arrays(cluster, meta, x, y, value)
-                cluster_id = np.full(num_points, i, dtype=self.ftype)
-                clusters_voxels.append(np.stack([x, y], axis=1))
-                clusters_features.append(np.column_stack([value, cluster_id]))
-
-        # If there are no non-empty clusters, return. Concatenate otherwise
-        if not clusters_voxels:
+        clusters_v = cluster_event_p.as_vector()
+        sizes, offsets = self.cluster_offsets(clusters_v)
+        num_points = offsets[-1]
+        if not num_points:
             return (np.empty((0, 2), dtype=self.ftype),
                     np.empty((0, 2), dtype=self.ftype),
                     Meta.from_larcv(meta))
 
-        np_voxels   = np.concatenate(clusters_voxels, axis=0)
-        np_features = np.concatenate(clusters_features, axis=0)
+        # Loop over clusters, fill their information in place
+        coords = np.empty((2, num_points), dtype=self.itype)
+        value = np.empty(num_points, dtype=self.ftype)
+        for i in np.flatnonzero(sizes):
+            start, end = offsets[i], offsets[i+1]
+            larcv.as_flat_arrays(
+                    clusters_v[i], meta, coords[0, start:end],
+                    coords[1, start:end], value[start:end])
+
+        np_voxels = coords.T
+        np_features = np.empty((num_points, 2), dtype=self.ftype)
+        cluster_ids = np.arange(len(sizes), dtype=self.ftype)[:, None]
+        fill_cluster_features(np_features, offsets, value, cluster_ids)
 
         return np_voxels, np_features, Meta.from_larcv(meta)
 
@@ -179,8 +179,11 @@ class Cluster3DParser(ParserBase):
         self.break_eps = break_eps
         self.break_metric = break_metric
 
-        # Intialize the sparse and particle parsers
+        # Intialize the sparse and particle parsers. Value tensors only need
+        # their features, as their voxels match those of the semantics.
         self.sparse_parser = Sparse3DParser(dtype, sparse_event='dummy')
+        self.sparse_value_parser = Sparse3DParser(
+                dtype, sparse_event='dummy', feature_only=True)
 
         # Do basic sanity checks
         if self.add_particle_info:
@@ -239,7 +242,8 @@ class Cluster3DParser(ParserBase):
         """
         # Get the cluster-wise information first
         meta = cluster_event.meta()
-        num_clusters = cluster_event.as_vector().size()
+        clusters_v = cluster_event.as_vector()
+        num_clusters = clusters_v.size()
         labels = OrderedDict()
         labels['cluster'] = np.arange(num_clusters)
         num_particles = num_clusters
@@ -272,9 +276,12 @@ class Cluster3DParser(ParserBase):
             labels['pinter']  = inter_primaries
 
             # Store the vertex and momentum
-            anc_pos = np.empty((len(particles), 3), dtype=self.ftype)
+            anc_pos = np.empty((len(particles), 3), dtype=np.float64)
             for i, p in enumerate(particles):
-                anc_pos[i] = image_coordinates(meta, p.ancestor_position())
+                pos = p.ancestor_position()
+                anc_pos[i] = pos.x(), pos.y(), pos.z()
+
+            anc_pos = image_coordinates(meta, anc_pos).astype(self.ftype)
             labels['vtx_x']   = anc_pos[:, 0]
             labels['vtx_y']   = anc_pos[:, 1]
             labels['vtx_z']   = anc_pos[:, 2]
@@ -285,12 +292,12 @@ class Cluster3DParser(ParserBase):
 
             # If requested, give invalid labels to a subset of particles
             if not self.type_include_secondary:
-                secondary_mask = np.where(np.array(labels['pinter']) < 1)[0]
+                secondary_mask = np.array(labels['pinter']) < 1
                 labels['type'] = np.asarray(labels['type'])
                 labels['type'][secondary_mask] = -1
 
             if not self.type_include_mpr or not self.primary_include_mpr:
-                mpr_mask = np.where(np.array(labels['nu']) < 0)[0]
+                mpr_mask = np.array(labels['nu']) < 0
                 if not self.type_include_mpr:
                     labels['type'] = np.asarray(labels['type'])
                     labels['type'][mpr_mask] = -1
@@ -298,46 +305,45 @@ class Cluster3DParser(ParserBase):
                     labels['pinter'] = np.asarray(labels['pinter'])
                     labels['pinter'][mpr_mask] = -1
 
-        # Loop over clusters, store information
-        clusters_voxels, clusters_features = [], []
-        id_offset = 0
-        for i in range(num_clusters):
-            cluster = cluster_event.as_vector()[i]
-            num_points = cluster.as_vector().size()
-            if num_points > 0:
-                # Get the position and pixel value from EventSparseTensor3D
-                x = np.empty(num_points, dtype=self.itype)
-                y = np.empty(num_points, dtype=self.itype)
-                z = np.empty(num_points, dtype=self.itype)
-                value = np.empty(num_points, dtype=self.ftype)
-                larcv.as_flat_arrays(cluster, meta, x, y, z, value)
-                voxels = np.stack([x, y, z], axis=1)
-                clusters_voxels.append(voxels)
-
-                # Append the cluster-wise information
-                features = [value]
-                for l in labels.values():
-                    val = l[i] if i < num_particles else -1
-                    features.append(
-                            np.full(num_points, val, dtype=self.ftype))
-
-                # If requested, break cluster into detached pieces
-                if self.break_clusters:
-                    frag_labels = dbscan(
-                            voxels, self.break_eps, self.break_metric)
-                    features[1] = id_offset + frag_labels
-                    id_offset += max(frag_labels) + 1
-
-                clusters_features.append(np.column_stack(features))
-
-        # If there are no non-empty clusters, return. Concatenate otherwise
-        if not clusters_voxels:
+        # Get the size of each cluster, check that there is something to load
+        sizes, offsets = self.cluster_offsets(clusters_v)
+        num_points = offsets[-1]
+        if not num_points:
             return (np.empty((0, 3), dtype=self.itype),
                     np.empty((0, len(labels) + 1), dtype=self.ftype),
                     Meta.from_larcv(meta))
 
-        np_voxels   = np.concatenate(clusters_voxels, axis=0)
-        np_features = np.concatenate(clusters_features, axis=0)
+        # Loop over clusters, fill the position and pixel value in place
+        coords = np.empty((3, num_points), dtype=self.itype)
+        value = np.empty(num_points, dtype=self.ftype)
+        for i in np.flatnonzero(sizes):
+            start, end = offsets[i], offsets[i+1]
+            larcv.as_flat_arrays(
+                    clusters_v[i], meta, coords[0, start:end],
+                    coords[1, start:end], coords[2, start:end],
+                    value[start:end])
+
+        np_voxels = coords.T
+
+        # Broadcast the cluster-wise information to each voxel
+        cluster_labels = np.full(
+                (num_clusters, len(labels)), -1, dtype=self.ftype)
+        for j, l in enumerate(labels.values()):
+            cluster_labels[:num_particles, j] = l[:num_particles]
+
+        np_features = np.empty((num_points, len(labels) + 1), dtype=self.ftype)
+        fill_cluster_features(np_features, offsets, value, cluster_labels)
+
+        # If requested, break cluster into detached pieces
+        if self.break_clusters:
+            id_offset = 0
+            for i in np.flatnonzero(sizes):
+                start, end = offsets[i], offsets[i+1]
+                frag_labels = dbscan(
+                        np_voxels[start:end], self.break_eps,
+                        self.break_metric)
+                np_features[start:end, 1] = id_offset + frag_labels
+                id_offset += max(frag_labels) + 1
 
         # If requested, remove duplicate voxels (cluster overlaps) and
         # match the semantics to those of the provided reference
@@ -368,8 +374,8 @@ class Cluster3DParser(ParserBase):
 
             # If a value tree is provided, override value colum
             if sparse_value_event:
-                _, val_features, _  = (
-                        self.sparse_parser.process(sparse_value_event))
+                val_features = (
+                        self.sparse_value_parser.process(sparse_value_event))
                 np_features[:, 0] = val_features[:, -1]
 
         return np_voxels, np_features, Meta.from_larcv(meta)
@@ -499,11 +505,40 @@ class Cluster3DMultiModuleParser(Cluster3DParser):
         np_voxels, np_features, meta = self.process(**kwargs)
 
         # Fetch the charge information
-        charges = np.zeros((len(np_voxels), 1), dtype=np.float32)
+        charges = np.zeros(len(np_voxels), dtype=np.float32)
         for sparse_value_event in sparse_value_event_list:
-            _, charges_i, _ = self.sparse_parser.process(sparse_value_event)
-            charges[charges == 0.] = charges_i[charges == 0.]
+            charges_i = self.sparse_value_parser.process(sparse_value_event)
+            zero_mask = charges == 0.
+            charges[zero_mask] = charges_i[zero_mask, -1]
 
-        np_features[:, 0] = charges.flatten()
+        np_features[:, 0] = charges
 
         return np_voxels, np_features, meta
+
+
+@nb.njit(parallel=True, cache=True)
+def fill_cluster_features(features: nb.float32[:,:],
+                          offsets: nb.int64[:],
+                          values: nb.float32[:],
+                          labels: nb.float32[:,:]) -> None:
+    """Fills the feature tensor of a set of concatenated clusters in place.
+
+    The first column receives the value of each voxel, the remaining columns
+    receive the cluster-wise labels of the cluster each voxel belongs to.
+
+    Parameters
+    ----------
+    features : np.ndarray
+        (N, 1 + L) Feature tensor to fill
+    offsets : np.ndarray
+        (C + 1) Offset of each cluster in the concatenated tensor
+    values : np.ndarray
+        (N) Value of each voxel
+    labels : np.ndarray
+        (C, L) Labels of each cluster
+    """
+    # Loop over the clusters (parallelize), fill each block of voxels
+    for i in nb.prange(len(offsets) - 1):
+        for k in range(offsets[i], offsets[i+1]):
+            features[k, 0] = values[k]
+            features[k, 1:] = labels[i]
@@ -190,8 +190,9 @@ class FlashParser(ParserBase):
             for flash_event in flash_event_list:
                 flash_list.extend(flash_event.as_vector())
 
-        # Output as a list of LArCV optical flash objects
-        flashes = [Flash.from_larcv(larcv.Flash(f)) for f in flash_list]
+        # Output as a list of optical flash objects. The attributes are
+        # copied out by `from_larcv`, no need to copy construct the flashes
+        flashes = [Flash.from_larcv(f) for f in flash_list]
 
         return ObjectList(flashes, Flash())
 
@@ -229,9 +230,10 @@ class CRTHitParser(ParserBase):
         List[CRTHit]
             List of CRT hit objects
         """
-        # Output as a list of LArCV CRT hit objects
+        # Output as a list of CRT hit objects. The attributes are copied
+        # out by `from_larcv`, no need to copy construct the hits
         crthit_list = crthit_event.as_vector()
-        crthits = [CRTHit.from_larcv(larcv.CRTHit(c)) for c in crthit_list]
+        crthits = [CRTHit.from_larcv(c) for c in crthit_list]
 
         return ObjectList(crthits, CRTHit())
 
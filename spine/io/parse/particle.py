@@ -142,10 +142,9 @@ class ParticleParser(ParserBase):
                     sparse_event if sparse_event is not None else cluster_event)
             meta = Meta.from_larcv(ref_event.meta())
 
-            # Convert all the relevant attributes
-            for p in particles:
-                if p.id > -1:
-                    p.to_px(meta)
+            # Convert all the relevant attributes of all particles at once
+            valid_particles = [p for p in particles if p.id > -1]
+            Particle.batch_to_px(valid_particles, meta)
 
         return ObjectList(particles, Particle())
 
@@ -382,14 +381,22 @@ class ParticleCoordinateParser(ParserBase):
         # Scale particle coordinates to image size
         particles_v = particle_event.as_vector()
 
-        # Make features
-        features = np.empty((len(particles_v), 8), dtype=self.ftype)
+        # Fetch the raw particle coordinates (in cm), time and shape
+        num_particles = len(particles_v)
+        points = np.empty((num_particles, 2, 3), dtype=np.float64)
+        features = np.empty((num_particles, 8), dtype=self.ftype)
         for i, p in enumerate(particles_v):
-            start_point = last_point = image_coordinates(meta, p.first_step())
+            step = p.first_step()
+            points[i, 0] = step.x(), step.y(), step.z()
             if p.shape() == TRACK_SHP: # End point only meaningful for tracks
-                last_point = image_coordinates(meta, p.last_step())
-            extra = [p.t(), p.shape()]
-            features[i] = np.concatenate((start_point, last_point, extra))
+                step = p.last_step()
+                points[i, 1] = step.x(), step.y(), step.z()
+            else:
+                points[i, 1] = points[i, 0]
+            features[i, 6:] = p.t(), p.shape()
+
+        # Convert all the coordinates to pixel units at once
+        features[:, :6] = image_coordinates(meta, points).reshape(-1, 6)
 
         return features[:, :6], features[:, 6:], Meta.from_larcv(meta)
 
@@ -438,24 +445,31 @@ class ParticleGraphParser(ParserBase):
         int
             Number of particles in the input
         """
+        # Fetch the particle IDs once
         particles_v   = particle_event.as_vector()
         num_particles = particles_v.size()
-        edges         = []
+        part_ids      = np.empty(num_particles, dtype=np.int64)
+        parent_ids    = np.empty(num_particles, dtype=np.int64)
+        group_ids     = np.empty(num_particles, dtype=np.int64)
+        for i in range(num_particles):
+            p = particles_v[i]
+            part_ids[i] = p.id()
+            parent_ids[i] = p.parent_id()
+            group_ids[i] = p.group_id()
+
         if cluster_event is None:
-            # Fill edges (directed [parent, child] pair)
-            edges = []
-            for cluster_id in range(num_particles):
-                p = particles_v[cluster_id]
-                if p.parent_id() != p.id():
-                    edges.append([int(p.parent_id()), cluster_id])
-                if p.parent_id() == p.id() and p.group_id() != p.id():
-                    edges.append([int(p.group_id()), cluster_id])
-
-            # Convert the list of edges to a numpy array
-            if not edges:
+            # Fill edges (directed [parent, child] pair). If a particle is its
+            # own parent, connect it to its group instead, if distinct.
+            parent_mask = parent_ids != part_ids
+            group_mask = ~parent_mask & (group_ids != part_ids)
+            keep = np.where(parent_mask | group_mask)[0]
+            if not len(keep):
                 return np.empty((2, 0), dtype=np.int64), num_particles
 
-            edges = np.vstack(edges).astype(np.int64)
+            edges = np.empty((len(keep), 2), dtype=np.int64)
+            edges[:, 0] = np.where(
+                    parent_mask[keep], parent_ids[keep], group_ids[keep])
+            edges[:, 1] = keep
 
         else:
             # Check that the cluster and particle objects are consistent
@@ -466,25 +480,21 @@ class ParticleGraphParser(ParserBase):
                     f"aligned with the number of clusters ({num_clusters}). "
                     f"There can me one more catch-all cluster at the end.")
 
+            # Only consider group primaries
+            clusters_v = cluster_event.as_vector()
+            primary_index = np.where(part_ids == group_ids)[0]
+            zero_nodes = [group_ids[i] for i in primary_index
+                          if clusters_v[int(i)].as_vector().size() == 0]
+
             # Fill edges (directed [parent, child] pair)
-            zero_nodes, zero_nodes_pid = [], []
-            for cluster_id in range(num_particles):
-                cluster = cluster_event.as_vector()[cluster_id]
-                num_points = cluster.as_vector().size()
-                p = particles_v[cluster_id]
-                if p.id() != p.group_id():
-                    continue
-                if p.parent_id() != p.group_id():
-                    edges.append([int(p.parent_id()), p.group_id()])
-                if num_points == 0:
-                    zero_nodes.append(p.group_id())
-                    zero_nodes_pid.append(cluster_id)
-
-            # Convert the list of edges to a numpy array
-            if not edges:
+            keep = primary_index[
+                    parent_ids[primary_index] != group_ids[primary_index]]
+            if not len(keep):
                 return np.empty((2, 0), dtype=np.int64), num_particles
 
-            edges = np.vstack(edges).astype(np.int64)
+            edges = np.empty((len(keep), 2), dtype=np.int64)
+            edges[:, 0] = parent_ids[keep]
+            edges[:, 1] = group_ids[keep]
 
             # Remove zero pixel nodes
             for zn in zero_nodes:
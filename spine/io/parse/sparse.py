@@ -102,8 +102,8 @@ class Sparse2DParser(ParserBase):
 
         # Loop over the list of sparse events
         np_voxels, meta, num_points = None, None, None
-        np_features = []
-        for sparse_event in sparse_event_list:
+        np_features = None
+        for i, sparse_event in enumerate(sparse_event_list):
             # Get the tensor from the appropriate projection
             tensor = sparse_event.sparse_tensor_2d(self.projection_id)
 
@@ -113,18 +113,18 @@ class Sparse2DParser(ParserBase):
                 num_points = tensor.as_vector().size()
                 np_voxels = np.empty((num_points, 2), dtype=self.itype)
                 larcv.fill_2d_voxels(tensor, np_voxels)
+                np_features = self.empty_features(
+                        num_points, len(sparse_event_list))
             else:
                 assert meta == tensor.meta(), (
                         "The metadata must match between tensors")
                 assert num_points == tensor.as_vector().size(), (
                         "The number of pixels must match between tensors")
 
-            # Get the feature vector for this tensor
-            np_data = np.empty((num_points, 1), dtype=self.ftype)
-            larcv.fill_2d_pcloud(tensor, np_data)
-            np_features.append(np_data)
+            # Fill the feature vector for this tensor in place
+            larcv.fill_2d_pcloud(tensor, np_features[:, i:i+1])
 
-        return np_voxels, np.hstack(np_features), Meta.from_larcv(meta)
+        return np_voxels, np_features, Meta.from_larcv(meta)
 
 
 class Sparse3DParser(ParserBase):
@@ -242,13 +242,28 @@ class Sparse3DParser(ParserBase):
             split_sparse_event_list = np.split(
                     np.array(sparse_event_list), num_groups)
 
+        # Get the feature column of each tensor (leave room for `nhits`)
+        feat_cols = np.arange(self.num_features)
+        num_cols = self.num_features
+        if self.compute_nhits:
+            if self.nhits_idx < 0 or self.nhits_idx > self.num_features:
+                raise ValueError(
+                        f"`nhits_idx` ({self.nhits_idx}) is out of range.")
+            feat_cols[self.nhits_idx:] += 1
+            num_cols += 1
+
+        # Allocate the output once, each list fills its own block of rows
+        sizes = [l[0].as_vector().size() for l in split_sparse_event_list]
+        offsets = np.cumsum([0] + sizes)
+        np_voxels = None
+        if not self.feature_only:
+            np_voxels = np.empty((offsets[-1], 3), dtype=self.itype)
+        np_features = self.empty_features(offsets[-1], num_cols)
+
         # Loop over the individual lists, load the voxels/features
-        all_voxels, all_features = [], []
         meta = None
-        for sparse_event_list in split_sparse_event_list:
-            np_voxels, num_points = None, None
-            np_features = []
-            hit_key_array = []
+        for i, sparse_event_list in enumerate(split_sparse_event_list):
+            start, end = offsets[i], offsets[i+1]
             for idx, sparse_event in enumerate(sparse_event_list):
                 # Get the shared information
                 if meta is None:
@@ -257,45 +272,26 @@ class Sparse3DParser(ParserBase):
                     assert meta == sparse_event.meta(), (
                             "The metadata must match between tensors")
 
-                if num_points is None:
-                    num_points = sparse_event.as_vector().size()
-                    if not self.feature_only:
-                        np_voxels = np.empty((num_points, 3), dtype=self.itype)
-                        larcv.fill_3d_voxels(sparse_event, np_voxels)
-                else:
-                    assert num_points == sparse_event.as_vector().size(), (
-                            "The number of pixels must match between tensors")
-
-                # Get the feature vector for this tensor
-                np_data = np.empty((num_points, 1), dtype=self.ftype)
-                larcv.fill_3d_pcloud(sparse_event, np_data)
-                np_features.append(np_data)
-
-                # If the number of hits is to be computed, keep track of the
-                # required information to do so downstream
-                if self.compute_nhits:
-                    if idx in self.hit_keys:
-                        hit_key_array.append(np_data)
-
-            # If requested, add a feature related to the number of planes
-            if self.compute_nhits:
-                hit_key_array = np.hstack(hit_key_array)
-                nhits = np.sum(hit_key_array >= 0., axis=1)[:, -1]
-                if self.nhits_idx < 0 or self.nhits_idx > self.num_features:
-                    raise ValueError(
-                            f"`nhits_idx` ({self.nhits_idx}) is out of range.")
-                np_features.insert(self.nhits_idx, nhits)
-
-            # Append to the global list of voxel/features
-            if not self.feature_only:
-                all_voxels.append(np_voxels)
-            all_features.append(np.hstack(np_features))
+                assert sizes[i] == sparse_event.as_vector().size(), (
+                        "The number of pixels must match between tensors")
+                if idx == 0 and not self.feature_only:
+                    larcv.fill_3d_voxels(sparse_event, np_voxels[start:end])
+
+                # Fill the feature vector for this tensor in place
+                col = feat_cols[idx]
+                larcv.fill_3d_pcloud(
+                        sparse_event, np_features[start:end, col:col+1])
+
+        # If requested, add a feature related to the number of planes
+        if self.compute_nhits:
+            hit_key_cols = feat_cols[self.hit_keys]
+            np_features[:, self.nhits_idx] = np.sum(
+                    np_features[:, hit_key_cols] >= 0., axis=1)
 
         if self.feature_only:
-            return np.vstack(all_features)
+            return np_features
         else:
-            return (np.vstack(all_voxels), np.vstack(all_features),
-                    Meta.from_larcv(meta))
+            return np_voxels, np_features, Meta.from_larcv(meta)
 
 
 class Sparse3DGhostParser(Sparse3DParser):
@@ -410,7 +406,7 @@ class Sparse3DChargeRescaledParser(Sparse3DParser):
         np_voxels, np_data, meta = self.process(
                 sparse_event_list=sparse_event_list)
 
-        deghost_mask = np.where(np_data[:, -1] < GHOST_SHP)[0]
+        deghost_mask = np_data[:, -1] < GHOST_SHP
         charges = compute_rescaled_charge(
                 np_data[deghost_mask, :-1],
                 collection_only=self.collection_only,
@@ -616,10 +616,12 @@ class HDF5Writer:
         obj_dtype : list
             List of (key, dtype) pairs which specify what's to store
         """
-        # Convert list of objects to list of storable objects
+        # Convert list of objects to a structured array of records. The
+        # attributes are fetched directly to avoid deep-copying each object.
         objects = np.empty(len(array), obj_dtype)
+        names = objects.dtype.names
         for i, obj in enumerate(array):
-            objects[i] = tuple(obj.as_dict().values())
+            objects[i] = tuple(getattr(obj, name) for name in names)
 
         # Extend the dataset, store array
         dataset = out_file[key]
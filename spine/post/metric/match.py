@@ -7,6 +7,8 @@ import numba as nb
 
 import spine.utils.match
 
+from spine.data.base import empty_array
+
 from spine.post.base import PostBase
 
 __all__ = ['MatchProcessor']
@@ -232,27 +234,34 @@ class MatchProcessor(PostBase):
         overlaps : List[float]
             (N) List of overlap between each source and the best matched target
         """
+        # Order the targets of each source by decreasing overlap at once,
+        # pushing the invalid matches to the end of each row. Ties are
+        # broken in favor of the target with the highest index.
+        num_matches = np.sum(ovl_valid, axis=1)
+        sort_key = np.where(ovl_valid, ovl_matrix, -np.inf)
+        match_index = np.ascontiguousarray(
+                np.argsort(sort_key, axis=1, kind='stable')[:, ::-1])
+        match_overlaps = np.take_along_axis(ovl_matrix, match_index, axis=1)
+
         # Build the matches based on the threshold
         pairs, pair_overlaps = [], []
         for i, s in enumerate(source_objs):
             # Get the list of valid matches
-            match_idxs = np.where(ovl_valid[i])[0]
-            if not len(match_idxs):
+            num_match = num_matches[i]
+            if not num_match:
                 # If there are no matches, fill dummy values
                 s.is_matched = False
-                s.match_ids = np.empty(0, dtype=np.int64)
-                s.match_overlaps = np.empty(0, dtype=np.float32)
+                s.match_ids = empty_array(np.int64)
+                s.match_overlaps = empty_array(np.float32)
 
                 pairs.append((s, None))
                 pair_overlaps.append(-1.)
 
             else:
-                # If there are matches, order them by decreasing overlap
-                overlaps = ovl_matrix[i, match_idxs]
-                perm = np.argsort(overlaps)[::-1]
+                # If there are matches, store them as views of the ordered rows
                 s.is_matched = True
-                s.match_ids = match_idxs[perm]
-                s.match_overlaps = overlaps[perm]
+                s.match_ids = match_index[i, :num_match]
+                s.match_overlaps = match_overlaps[i, :num_match]
 
                 best_idx = s.match_ids[0]
                 pairs.append((s, target_objs[best_idx]))
@@ -47,31 +47,68 @@ class ParticleShapeLogicProcessor(PostBase):
         data : dict
             Dictionaries of data products
         """
-        # Loop over the particle objects
-        for part in data['reco_particles']:
-            # Reset the PID scores
-            if self.enforce_pid:
-                pid_range = SHP_TO_PID[part.shape]
-                pid_range = pid_range[pid_range < len(part.pid_scores)]
-
-                pid_scores = np.zeros(
-                        len(part.pid_scores), dtype=part.pid_scores.dtype)
-                pid_scores[pid_range] = part.pid_scores[pid_range]
-                pid_scores /= np.sum(pid_scores)
-                part.pid_scores = pid_scores
-                part.pid = np.argmax(pid_scores)
-
-            # Reset the primary scores
-            if self.enforce_primary:
-                primary_range = SHP_TO_PRIMARY[part.shape]
-
-                primary_scores = np.zeros(
-                        len(part.primary_scores),
-                        dtype=part.primary_scores.dtype)
-                primary_scores[primary_range] = part.primary_scores[primary_range]
-                primary_scores /= np.sum(primary_scores)
-                part.primary_scores = primary_scores
-                part.is_primary = bool(np.argmax(primary_scores))
+        # If there are no particles in this entry, nothing to do
+        particles = data['reco_particles']
+        if not len(particles):
+            return
+
+        # Process all the particles of the entry at once
+        shapes = np.array([part.shape for part in particles])
+
+        # Reset the PID scores
+        if self.enforce_pid:
+            pid_scores = np.vstack([part.pid_scores for part in particles])
+            pid_scores = self.restrict_scores(pid_scores, shapes, SHP_TO_PID)
+            pid_pred = np.argmax(pid_scores, axis=1)
+            for i, part in enumerate(particles):
+                part.pid_scores = pid_scores[i]
+                part.pid = pid_pred[i]
+
+        # Reset the primary scores
+        if self.enforce_primary:
+            primary_scores = np.vstack(
+                    [part.primary_scores for part in particles])
+            primary_scores = self.restrict_scores(
+                    primary_scores, shapes, SHP_TO_PRIMARY)
+            primary_pred = np.argmax(primary_scores, axis=1)
+            for i, part in enumerate(particles):
+                part.primary_scores = primary_scores[i]
+                part.is_primary = bool(primary_pred[i])
+
+    @staticmethod
+    def restrict_scores(scores, shapes, shape_map):
+        """Zeroes out the scores of the classes not allowed by the shape of
+        each particle, then renormalizes the remaining scores.
+
+        Parameters
+        ----------
+        scores : np.ndarray
+            (P, C) Array of softmax scores of each particle
+        shapes : np.ndarray
+            (P) Semantic type of each particle
+        shape_map : Dict[int, np.ndarray]
+            Maps each shape onto the list of classes it allows
+
+        Returns
+        -------
+        np.ndarray
+            (P, C) Array of restricted softmax scores
+        """
+        # Build a mask of allowed classes. Particles with a shape which does
+        # not appear in the map are left untouched.
+        mask = np.ones(scores.shape, dtype=bool)
+        for shape, allowed in shape_map.items():
+            index = np.where(shapes == shape)[0]
+            if len(index):
+                allowed = allowed[allowed < scores.shape[1]]
+                mask[index] = False
+                mask[np.ix_(index, allowed)] = True
+
+        # Restrict and renormalize the scores
+        scores = np.where(mask, scores, 0.).astype(scores.dtype, copy=False)
+        scores /= np.sum(scores, axis=1, keepdims=True)
+
+        return scores
 
 
 class ParticleThresholdProcessor(PostBase):
@@ -120,37 +157,79 @@ class ParticleThresholdProcessor(PostBase):
         data : dict
             Dictionary of data products
         """
-        # Loop over the particle objects
-        for part in data['reco_particles']:
-            # Fetch the appropriate thresholds
-            if part.shape == TRACK_SHP:
-                pid_thresholds = self.track_pid_thresholds
-            else:
-                pid_thresholds = self.shower_pid_thresholds
-
-            # Adjust the particle ID
-            if pid_thresholds is not None:
-                assigned = False
-                scores = np.copy(part.pid_scores)
-                for k, v in pid_thresholds.items():
-                    if scores[k] >= v:
-                        # Assign a PID
-                        part.pid = k
-                        assigned = True
-                        break
-                    else:
-                        # Re-normalize softmax probabilities
-                        scores *= 1./(1 - scores[k])
-
-                assert assigned, (
-                        "Must specify a PID threshold for all or no particle "
-                        "type.")
-
-            # Adjust the primary ID
-            if self.primary_threshold is not None:
+        # If there are no particles in this entry, nothing to do
+        particles = data['reco_particles']
+        if not len(particles):
+            return
+
+        # Adjust the particle ID of all the particles in the entry at once,
+        # using the set of thresholds which corresponds to their shape
+        if (self.track_pid_thresholds is not None or
+            self.shower_pid_thresholds is not None):
+            pid_scores = np.vstack([part.pid_scores for part in particles])
+            track_mask = np.array([part.shape == TRACK_SHP for part in particles])
+            pid_pred = np.array([part.pid for part in particles])
+            for mask, pid_thresholds in (
+                    (track_mask, self.track_pid_thresholds),
+                    (~track_mask, self.shower_pid_thresholds)):
+                if pid_thresholds is not None and np.any(mask):
+                    pid_pred[mask] = self.threshold_scores(
+                            pid_scores[mask], pid_thresholds)
+
+            for i, part in enumerate(particles):
+                part.pid = int(pid_pred[i])
+
+        # Adjust the primary ID
+        if self.primary_threshold is not None:
+            for part in particles:
                 part.is_primary = bool(
                         part.primary_scores[1] >= self.primary_threshold)
 
+    @staticmethod
+    def threshold_scores(scores, thresholds):
+        """Assigns a class to each particle by testing its scores against an
+        ordered list of thresholds.
+
+        The first class for which the score passes its threshold is assigned.
+        If a class fails its threshold, it is removed from the softmax scores
+        of the particle, which are renormalized before checking the next one.
+
+        Parameters
+        ----------
+        scores : np.ndarray
+            (P, C) Array of softmax scores of each particle
+        thresholds : dict
+            Ordered dictionary which maps a class onto a threshold value
+
+        Returns
+        -------
+        np.ndarray
+            (P) Class assigned to each particle
+        """
+        # Loop over classes in order, rather than over particles. The scores
+        # are copied in their own precision, to compare them as is.
+        scores = np.array(scores, copy=True)
+        pred = np.full(len(scores), -1, dtype=np.int64)
+        pending = np.ones(len(scores), dtype=bool)
+        for k, v in thresholds.items():
+            # Assign the class to the particles which pass the threshold
+            passed = pending & (scores[:, k] >= v)
+            pred[passed] = k
+            pending &= ~passed
+
+            # Re-normalize softmax probabilities of the remaining particles
+            if np.any(scores[pending, k] >= 1.):
+                raise ValueError(
+                        "Cannot renormalize the scores of a particle which "
+                        f"has a score of 1 for class {k}, as it does not pass "
+                        f"its threshold ({v}).")
+            scores[pending] *= 1./(1. - scores[pending, k:k+1])
+
+        assert not np.any(pending), (
+                "Must specify a PID threshold for all or no particle type.")
+
+        return pred
+
 
 class InteractionTopologyProcessor(PostBase):
     """Adjust the topology of interactions by applying thresholds on the
@@ -122,11 +122,12 @@ def find_cluster_means(features, labels):
         distinct instances. Each row is a (1,d) vector corresponding to
         the coordinates of the i-th centroid.
     '''
-    group_ids = sorted(np.unique(labels).astype(int))
+    labels = labels.astype(int)
+    group_ids = np.unique(labels)
     cluster_means = []
     #print(group_ids)
     for c in group_ids:
-        index = labels.astype(int) == c
+        index = labels == c
         mu_c = features[index].mean(0)
         cluster_means.append(mu_c)
     cluster_means = np.vstack(cluster_means)
@@ -229,10 +229,9 @@ class Geometry:
         of each module and the total number of moudules.
         """
         self.modules = np.empty((len(self.boundaries), 3, 2))
-        self.centers = np.empty((len(self.boundaries), 3))
-        for m, module in enumerate(self.boundaries):
-            self.modules[m] = self.merge_volumes(module)
-            self.centers[m] = np.mean(self.modules[m], axis=1)
+        self.modules[..., 0] = np.min(self.boundaries[..., 0], axis=1)
+        self.modules[..., 1] = np.max(self.boundaries[..., 1], axis=1)
+        self.centers = np.mean(self.modules, axis=-1)
 
     def build_detector(self):
         """Converts the list of boundaries of TPCs that make up the detector
@@ -303,14 +302,10 @@ class Geometry:
             (2, N_t) Pair of arrays: the first contains the list of
             contributing modules, the second of contributing tpcs.
         """
-        sources = np.unique(sources, axis=0)
-        contributor_mask = np.zeros(self.boundaries.shape[:2], dtype=bool)
-        for m, module_source in enumerate(self.sources):
-            for t, tpc_source in enumerate(module_source):
-                for source in sources:
-                    if (tpc_source == source).all(axis=-1).any(axis=-1):
-                        contributor_mask[m, t] = True
-                        break
+        # Compare packed [module ID, tpc ID] keys rather than rows
+        keys = np.unique(self.source_keys(sources))
+        contributor_mask = np.isin(
+                self.source_keys(self.sources), keys).any(axis=-1)
 
         return np.where(contributor_mask)
 
@@ -333,9 +328,8 @@ class Geometry:
         np.ndarray
             (N) Index of points that belong to that TPC
         """
-        mask = np.zeros(len(sources), dtype=bool)
-        for source in self.sources[module_id, tpc_id]:
-            mask |= (sources == source).all(axis=-1)
+        mask = np.isin(self.source_keys(sources),
+                       self.source_keys(self.sources[module_id, tpc_id]))
 
         return np.where(mask)[0]
 
@@ -724,6 +718,24 @@ class Geometry:
 
         return volume
 
+    @staticmethod
+    def source_keys(sources):
+        """Packs each [module ID, tpc ID] pair into a single integer key.
+
+        Parameters
+        ----------
+        sources : np.ndarray
+            (..., 2) Array of [module ID, tpc ID] pairs
+
+        Returns
+        -------
+        np.ndarray
+            (...) Array of unique int64 keys, one per pair
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+
+        return (sources[..., 0] << 32) | (sources[..., 1] & 0xFFFFFFFF)
+
     @staticmethod
     def merge_volumes(volumes):
         """Given a list of volumes and their boundaries, find the smallest box
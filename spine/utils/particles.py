@@ -244,13 +244,12 @@ def get_nu_ids(particles, inter_ids, particles_mpv=None, neutrinos=None):
         # Loop over the interactions
         primary_ids = get_inter_primary_ids(particles, inter_ids > -1)
         nu_id = 0
-        for i in np.unique(inter_ids):
+        for i, inter_index in zip(*get_group_index(inter_ids)):
             # If the interaction ID is invalid, skip
             if i < 0:
                 continue
 
             # If there are at least two primaries, the interaction is nu-like
-            inter_index = np.where(inter_ids == i)[0]
             if np.sum(primary_ids[inter_index] == 1) > 1:
                 nu_ids[inter_index] = nu_id
                 nu_id += 1
@@ -272,13 +271,12 @@ def get_nu_ids(particles, inter_ids, particles_mpv=None, neutrinos=None):
 
         # If an interaction ID is provided for neutrinos, the matching is trivial
         if ref_ids is not None:
-            for i in np.unique(inter_ids):
+            for i, inter_index in zip(*get_group_index(inter_ids)):
                 # If the interaction is invalid, skip
                 if i < 0:
                     continue
 
                 # Loop over positions in the interaction find a reference match
-                inter_index = np.where(inter_ids == i)[0]
                 for nu_id, ref_id in enumerate(ref_ids):
                     if i == ref_id:
                         nu_ids[inter_index] = nu_id
@@ -295,13 +293,12 @@ def get_nu_ids(particles, inter_ids, particles_mpv=None, neutrinos=None):
 
             anc_pos = np.vstack(
                     [get_coords(p.ancestor_position()) for p in particles])
-            for i in np.unique(inter_ids):
+            for i, inter_index in zip(*get_group_index(inter_ids)):
                 # If the interaction is invalid, skip
                 if i < 0:
                     continue
 
                 # Loop over positions in the interaction find a reference match
-                inter_index = np.where(inter_ids == i)[0]
                 for ref_id, pos in enumerate(ref_pos):
                     if np.any((anc_pos[inter_index] == pos).all(axis=1)):
                         nu_ids[inter_index] = ref_id
@@ -310,6 +307,71 @@ def get_nu_ids(particles, inter_ids, particles_mpv=None, neutrinos=None):
     return nu_ids
 
 
+def get_group_index(ids):
+    """Gets the index of the particles which share each unique ID.
+
+    This sorts the IDs once, rather than scanning the full ID array once
+    per unique ID.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        (P) Array of IDs, one per true particle instance
+
+    Results
+    -------
+    unique_ids : np.ndarray
+        (U) Sorted array of unique IDs
+    index : List[np.ndarray]
+        (U) Ordered index of the particles which share each unique ID
+    """
+    # If there are no IDs, nothing to do here
+    ids = np.asarray(ids)
+    if len(ids) == 0:
+        return ids, []
+
+    # For a compact range of IDs, count them rather than sorting them again
+    perm = np.argsort(ids, kind='stable')
+    min_id, max_id = int(ids[perm[0]]), int(ids[perm[-1]])
+    if max_id - min_id < max(len(ids), 1024):
+        counts = np.bincount((ids - min_id).astype(np.int64))
+        unique_ids = (np.flatnonzero(counts) + min_id).astype(ids.dtype)
+        starts = np.cumsum(counts[counts > 0])[:-1]
+    else:
+        unique_ids, starts = np.unique(ids[perm], return_index=True)
+        starts = starts[1:]
+
+    return unique_ids, np.split(perm, starts)
+
+
+def get_query_index(ids, query_ids):
+    """Gets the index of the particles which share each requested ID.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        (P) Array of IDs, one per true particle instance
+    query_ids : np.ndarray
+        (Q) Array of IDs to fetch the index of
+
+    Results
+    -------
+    List[np.ndarray]
+        (Q) Ordered index of the particles which share each requested ID.
+        The index is empty if the ID does not appear in the array.
+    """
+    # Partition the IDs once, look up each requested ID in the unique IDs
+    unique_ids, index = get_group_index(ids)
+    if not len(unique_ids):
+        return [np.empty(0, dtype=np.int64) for _ in query_ids]
+
+    pos = np.minimum(np.searchsorted(unique_ids, query_ids), len(index) - 1)
+    found = unique_ids[pos] == query_ids
+
+    return [index[p] if f else np.empty(0, dtype=np.int64)
+            for p, f in zip(pos, found)]
+
+
 def get_group_primary_ids(particles, valid_mask):
     """Gets the group primary status of particle fragments.
 
@@ -331,36 +393,45 @@ def get_group_primary_ids(particles, valid_mask):
     if valid_mask is None:
         valid_mask = get_valid_mask(particles)
 
-    # Loop over the list of particle groups
-    primary_ids = np.zeros(len(particles), dtype=int)
-    group_ids   = np.array([p.group_id() for p in particles], dtype=int)
-    for group_id in np.unique(group_ids):
-        # Check that the group ID is within the expected range
-        group_index = np.where(group_ids == group_id)[0]
-        if group_id != INVAL_ID and group_id > len(particles) - 1:
-            warn(f"Bad group ID ({group_id}) not matching INVAL_ID "
-                 f"({INVAL_ID}). This may happen for old files.")
-            primary_ids[group_index] = -1
-            continue
-
-        # If the particle group has invalid labeling, the concept of group
-        # primary is ill-defined
-        if group_id == INVAL_ID or not valid_mask[group_id]:
-            primary_ids[group_index] = -1
-            continue
-
-        # If a group originates from a Delta or a Michel, it has a primary
-        group_p = particles[group_id]
-        if group_p.shape() == MICHL_SHP or group_p.shape() == DELTA_SHP:
-            primary_ids[group_id] = 1
-            continue
-
-        # If a particle group's parent fragment is the first in time,
-        # it is a valid primary. TODO: use first step time.
-        clust_times = np.array([particles[i].t() for i in group_index])
-        min_id = np.argmin(clust_times)
-        if group_index[min_id] == group_id:
-            primary_ids[group_id] = 1
+    # If there are no particles, nothing to do here
+    num_particles = len(particles)
+    primary_ids = np.zeros(num_particles, dtype=int)
+    if num_particles == 0:
+        return primary_ids
+
+    # Fetch the necessary particle attributes once
+    group_ids = np.array([p.group_id() for p in particles], dtype=int)
+    shapes = np.array([p.shape() for p in particles], dtype=int)
+    times = np.array([p.t() for p in particles])
+
+    # Check that the group IDs are within the expected range
+    bad_mask = (group_ids != INVAL_ID) & (group_ids > num_particles - 1)
+    for group_id in np.unique(group_ids[bad_mask]):
+        warn(f"Bad group ID ({group_id}) not matching INVAL_ID "
+             f"({INVAL_ID}). This may happen for old files.")
+
+    # If the particle group has invalid labeling, the concept of group
+    # primary is ill-defined
+    inval_mask = bad_mask | (group_ids == INVAL_ID)
+    inval_mask[~inval_mask] = ~valid_mask[group_ids[~inval_mask]]
+
+    # If a particle group's parent fragment is the first in time,
+    # it is a valid primary. TODO: use first step time.
+    index = np.where(~inval_mask)[0]
+    index = index[np.lexsort((times[index], group_ids[index]))]
+    first_mask = np.ones(len(index), dtype=bool)
+    first_mask[1:] = group_ids[index[1:]] != group_ids[index[:-1]]
+    first_index = index[first_mask]
+    primary_ids[first_index[first_index == group_ids[first_index]]] = 1
+
+    # If a group originates from a Delta or a Michel, it has a primary
+    group_index = group_ids[first_index]
+    shape_mask = ((shapes[group_index] == MICHL_SHP) |
+                  (shapes[group_index] == DELTA_SHP))
+    primary_ids[group_index[shape_mask]] = 1
+
+    # Invalid groups take precedence (processed last, as they have large IDs)
+    primary_ids[inval_mask] = -1
 
     return primary_ids
 
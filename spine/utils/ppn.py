@@ -490,16 +490,19 @@ def get_ppn_labels(particle_v, meta, dtype, dim=3, min_voxel_count=1,
     Returns
     -------
     np.array
-        Array of points of shape (N, 5/6) where 5/6 = x,y,z + point type
-        + particle index [+ start (0) or end (1) point tagging]
+        Array of points of shape (N, D+2[+1]) where D+2[+1] = coordinates
+        + point type + particle index [+ start (0) or end (1) point tagging]
     """
     # Check on dimension
     if dim not in [2, 3]:
         raise ValueError("The image dimension must be either 2 or 3, "
                         f"got {dim} instead.")
 
-    # Loop over true particles
-    part_info = []
+    # Loop over true particles, fill the raw (cm) point coordinates and
+    # information in a preallocated buffer (at most two points per particle)
+    num_cols = dim + 2 + include_point_tagging
+    part_info = np.empty((2*len(particle_v), num_cols), dtype=np.float64)
+    num_points = 0
     for part_index, particle in enumerate(particle_v):
         # Check that the particle has the expected index
         if part_index != particle.id():
@@ -524,26 +527,30 @@ def get_ppn_labels(particle_v, meta, dtype, dim=3, min_voxel_count=1,
 
         # Skip low energy scatters and unknown shapes
         shape = particle.shape()
-        if particle.shape() in [LOWES_SHP, UNKWN_SHP]:
+        if shape in [LOWES_SHP, UNKWN_SHP]:
             continue
 
         # Append the start point with the rest of the particle information
-        first_step = image_coordinates(meta, particle.first_step(), dim)
-        part_extra = [shape, part_index, 0] \
-                if include_point_tagging else [shape, part_index]
-        part_info.append(first_step + part_extra)
-
-        # Append the end point as well, for tracks only
+        steps = [particle.first_step()]
         if shape == TRACK_SHP:
-            last_step  = image_coordinates(meta, particle.last_step(), dim)
-            part_extra = [shape, part_index, 1] \
-                    if include_point_tagging else [shape, part_index]
-            part_info.append(last_step + part_extra)
+            # Append the end point as well, for tracks only
+            steps.append(particle.last_step())
+
+        for tag, step in enumerate(steps):
+            row = part_info[num_points]
+            row[0], row[1] = step.x(), step.y()
+            if dim == 3:
+                row[2] = step.z()
+            row[dim:dim+2] = shape, part_index
+            if include_point_tagging:
+                row[-1] = tag
+            num_points += 1
 
-    if not len(part_info):
-        return np.empty((0, 5 + include_point_tagging), dtype=dtype)
+    # Convert the point coordinates to pixel units at once
+    part_info = part_info[:num_points]
+    part_info[:, :dim] = image_coordinates(meta, part_info[:, :dim], dim)
 
-    return np.array(part_info, dtype=dtype)
+    return part_info.astype(dtype)
 
 
 def image_contains(meta, point, dim=3):
@@ -572,30 +579,30 @@ def image_contains(meta, point, dim=3):
                 point.y() >= meta.min_y() and point.y() <= meta.max_y())
 
 
-def image_coordinates(meta, point, dim=3):
-    """Returns the coordinates of a point in units of pixels with an image.
+def image_coordinates(meta, points, dim=3):
+    """Returns the coordinates of a set of points in units of pixels within
+    an image.
 
     Parameters
     ----------
     meta : larcv::Voxel3DMeta or larcv::ImageMeta
         Metadata information
-    point : larcv::Point3D or larcv::Point2D
-        Point to convert the units of
+    points : np.ndarray
+        (..., D) Array of point coordinates in detector units (cm)
     dim: int, default 3
          Number of dimensions of the image
 
     Returns
     -------
-    bool
-        True if the point is contained in the image box
+    np.ndarray
+        (..., D) Array of point coordinates in pixel units
     """
-    x, y, z = point.x(), point.y(), point.z()
     if dim == 3:
-        x = (x - meta.min_x()) / meta.size_voxel_x()
-        y = (y - meta.min_y()) / meta.size_voxel_y()
-        z = (z - meta.min_z()) / meta.size_voxel_z()
-        return [x, y, z]
+        lower = np.array([meta.min_x(), meta.min_y(), meta.min_z()])
+        size = np.array([meta.size_voxel_x(), meta.size_voxel_y(),
+                         meta.size_voxel_z()])
     else:
-        x = (x - meta.min_x()) / meta.size_voxel_x()
-        y = (y - meta.min_y()) / meta.size_voxel_y()
-        return [x, y]
+        lower = np.array([meta.min_x(), meta.min_y()])
+        size = np.array([meta.size_voxel_x(), meta.size_voxel_y()])
+
+    return (points - lower)/size
@@ -78,11 +78,16 @@ def cone_trace(points, fraction=0.5, num_samples=10, color=None,
     # Rotate and offset the cone
     cone_points = start_pos + length*np.dot(unit_points, rotmat)
 
-    # Convert the color provided to a set of intensities
+    # Convert the color provided to a set of intensities. A named color
+    # is passed as is, as it is uniform across the mesh
+    intensity = None
     if color is not None:
-        assert np.isscalar('color'), (
+        assert np.isscalar(color), (
                 "Should provide a single color for the cone.")
-        intensity = [color]*len(cone_points)
+        if isinstance(color, str):
+            kwargs['color'] = color
+        else:
+            intensity = np.full(len(cone_points), color)
 
     # Append Mesh3d object
     return go.Mesh3d(
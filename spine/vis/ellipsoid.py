@@ -56,12 +56,16 @@ def ellipsoid_trace(points, contour=0.5, num_samples=10, color=None,
     radius = np.sqrt(2*gammaincinv(1.5, contour))
     ell_points = centroid + radius*np.dot(unit_points, rotmat)
 
-    # Convert the color provided to a set of intensities
+    # Convert the color provided to a set of intensities. A named color
+    # is passed as is, as it is uniform across the mesh
     intensity = None
     if color is not None:
-        assert np.isscalar('color'), (
+        assert np.isscalar(color), (
                 "Should provide a single color for the ellipsoid.")
-        intensity = [color]*len(ell_points)
+        if isinstance(color, str):
+            kwargs['color'] = color
+        else:
+            intensity = np.full(len(ell_points), color)
 
     # Append Mesh3d object
     return go.Mesh3d(
@@ -24,13 +24,16 @@ def hull_trace(points, color=None, showscale=False, alphahull=0, **kwargs):
     **kwargs : dict, optional
         Additional parameters to pass to the 
     """
-    # Convert the color provided to a set of intensities
+    # Convert the color provided to a set of intensities. A named color
+    # is passed as is, as it is uniform across the mesh
     intensity = None
     if color is not None:
-        if np.isscalar(color):
-            intensity = [color]*len(points)
+        if isinstance(color, str):
+            kwargs['color'] = color
+        elif np.isscalar(color):
+            intensity = np.full(len(points), color)
         else:
-            assert len(color) == points, (
+            assert len(color) == len(points), (
                     "The color must be a scalar or one value per point")
             intensity = color
 
@@ -0,0 +1,19 @@
+"""Test that the base data class routines work as intended."""
+
+import numpy as np
+
+from spine.data.out import RecoParticle
+
+
+def test_set_precision():
+    """Tests that only floating point attributes are recast, and that integer
+    indexes survive a reduction of the precision."""
+    index = np.array([0, 40000, 2**40], dtype=np.int64)
+    particle = RecoParticle(
+            index=index, points=np.random.rand(3, 3).astype(np.float32))
+    particle.set_precision(2)
+
+    assert particle.index.dtype == np.int64
+    np.testing.assert_array_equal(particle.index, index)
+    assert particle.points.dtype == np.float16
+    assert particle.start_point.dtype == np.float16
@@ -0,0 +1,51 @@
+"""Test that the cluster data cleaning routines work as intended."""
+
+import pytest
+
+import numpy as np
+
+from spine.utils.globals import SHAPE_COL, SHAPE_PREC
+import spine.io.parse.clean_data as clean_data
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_clean_sparse_data(seed, monkeypatch):
+    """Tests that the packed key cleaning matches the lexsort implementation."""
+    # Generate a cluster tensor with duplicates and a reference subset
+    rng = np.random.default_rng(seed)
+    num_points = 500
+    voxels = rng.integers(0, 8, size=(num_points, 3)).astype(np.int32)
+    data = np.zeros((num_points, 3), dtype=np.float32)
+    data[:, 0] = np.arange(num_points)
+    data[:, SHAPE_COL] = rng.choice(SHAPE_PREC, num_points)
+
+    unique_voxels = np.unique(voxels, axis=0)
+    ref_voxels = unique_voxels[rng.random(len(unique_voxels)) < 0.7]
+    ref_voxels = ref_voxels[rng.permutation(len(ref_voxels))]
+
+    # Clean the data using the packed keys
+    key_voxels, key_data = clean_data.clean_sparse_data(
+            voxels, data, ref_voxels)
+
+    # Clean the data using the lexsort fallback
+    monkeypatch.setattr(
+            clean_data, 'voxel_keys', lambda *voxel_list: [None]*len(voxel_list))
+    lex_voxels, lex_data = clean_data.clean_sparse_data(
+            voxels, data, ref_voxels)
+
+    # Check that both methods agree and that the output is as expected
+    # - There should be one voxel per reference voxel
+    # - Both methods should pick the same voxels, in the same order
+    assert len(key_voxels) == len(ref_voxels)
+    np.testing.assert_array_equal(key_voxels, lex_voxels)
+    np.testing.assert_array_equal(key_data, lex_data)
+
+
+@pytest.mark.parametrize('span', [4, 1000, 2**30])
+def test_lexsort_voxels(span):
+    """Tests that the radix voxel sort matches `np.lexsort`."""
+    rng = np.random.default_rng(span)
+    voxels = rng.integers(-span, span, size=(1000, 3)).astype(np.int32)
+
+    perm = clean_data.lexsort_voxels(voxels)
+    np.testing.assert_array_equal(perm, np.lexsort(voxels.T))
@@ -0,0 +1,35 @@
+"""Test that the match processor pairs objects as intended."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from spine.post.metric.match import MatchProcessor
+
+
+def test_generate_matches_ties():
+    """Tests that matches are ordered by decreasing overlap, that invalid
+    matches are dropped and that ties favor the highest target index."""
+    sources = [SimpleNamespace() for _ in range(3)]
+    targets = [SimpleNamespace() for _ in range(4)]
+    ovl_matrix = np.array([[0.5, 0.2, 0.5, 0.1],
+                           [0.3, 0.3, 0.3, 0.9],
+                           [0.1, 0.2, 0.3, 0.4]], dtype=np.float32)
+    ovl_valid = np.array([[True, True, True, False],
+                          [True, False, True, False],
+                          [False, False, False, False]])
+
+    pairs, overlaps = MatchProcessor.generate_matches(
+            sources, targets, ovl_matrix, ovl_valid)
+
+    # Check the ordering of the matches, ties included
+    np.testing.assert_array_equal(sources[0].match_ids, [2, 0, 1])
+    np.testing.assert_array_equal(sources[1].match_ids, [2, 0])
+    np.testing.assert_array_equal(
+            sources[0].match_overlaps, ovl_matrix[0, [2, 0, 1]])
+
+    # Check the best match of each source
+    assert pairs[0][1] is targets[2] and overlaps[0] == 0.5
+    assert pairs[1][1] is targets[2] and overlaps[1] == np.float32(0.3)
+    assert pairs[2][1] is None and overlaps[2] == -1.
+    assert not sources[2].is_matched and not len(sources[2].match_ids)
@@ -0,0 +1,35 @@
+"""Test that the particle truth information routines work as intended."""
+
+import pytest
+
+import numpy as np
+
+from spine.utils.globals import INVAL_ID
+from spine.utils.particles import get_group_index, get_query_index
+
+
+@pytest.mark.parametrize(
+        'ids', [[3, 1, 3, 2, 1], [-1, 0, INVAL_ID, 0, -1],
+                [-2**63, 5, 5], [10**9, 0, 10**9]])
+def test_get_group_index(ids):
+    """Tests that the group index matches a per-ID scan, including for
+    ID ranges which would overflow if subtracted in int64."""
+    ids = np.array(ids, dtype=np.int64)
+    unique_ids, index = get_group_index(ids)
+
+    np.testing.assert_array_equal(unique_ids, np.unique(ids))
+    assert len(index) == len(unique_ids)
+    for uid, idx in zip(unique_ids, index):
+        np.testing.assert_array_equal(idx, np.where(ids == uid)[0])
+
+
+def test_get_query_index():
+    """Tests that requested IDs absent from the array get an empty index."""
+    ids = np.array([2., -1., 2., 0., 5.])
+    index = get_query_index(ids, np.array([0, 1, 2, 6]))
+
+    assert len(index) == 4
+    np.testing.assert_array_equal(index[0], [3])
+    np.testing.assert_array_equal(index[2], [0, 2])
+    assert not len(index[1]) and not len(index[3])
+    assert not any(len(i) for i in get_query_index(ids[:0], [0, 1]))
@@ -0,0 +1,25 @@
+"""Test that the PPN label building routines work as intended."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from spine.utils.ppn import get_ppn_labels
+
+
+@pytest.mark.parametrize('dim', [2, 3])
+@pytest.mark.parametrize('include_point_tagging', [True, False])
+def test_get_ppn_labels_empty(dim, include_point_tagging):
+    """Tests that an empty particle list yields labels of the same width as
+    a non-empty one, i.e. dim + 2 (+ 1 for the point tag) columns."""
+    meta = SimpleNamespace(
+            min_x=lambda: 0., min_y=lambda: 0., min_z=lambda: 0.,
+            size_voxel_x=lambda: 1., size_voxel_y=lambda: 1.,
+            size_voxel_z=lambda: 1.)
+
+    labels = get_ppn_labels(
+            [], meta, 'float32', dim=dim,
+            include_point_tagging=include_point_tagging)
+
+    assert labels.shape == (0, dim + 2 + include_point_tagging)
+    assert labels.dtype == 'float32'